@@ -58,6 +58,13 @@ class CodeSmileCLI:
                 self.analyzer.analyze_projects_sequential(
                     self.args.input, resume=self.args.resume
                 )
+        elif self.args.parallel:
+            total_smells = self.analyzer.analyze_project(
+                self.args.input, max_workers=self.args.max_walkers
+            )
+            print(
+                f"Analysis completed. Total code smells found: {total_smells}"
+            )
         else:
             total_smells = self.analyzer.analyze_project(self.args.input)
             print(
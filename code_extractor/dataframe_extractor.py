@@ -1,5 +1,86 @@
 import ast
-import pandas as pd
+import csv
+import functools
+import os
+import sys
+import weakref
+
+# Node types bound once at module level for the exact `type(node) is`
+# checks of the hot loops; `ast.parse` never produces subclasses of them
+_Assign = ast.Assign
+_Attribute = ast.Attribute
+_Call = ast.Call
+_Constant = ast.Constant
+_Name = ast.Name
+_Subscript = ast.Subscript
+
+# Assignments, calls and subscripts of each function node, in `ast.walk`
+# order; entries are dropped along with the trees they index
+_node_index = weakref.WeakKeyDictionary()
+
+
+def _read_methods(csv_file) -> tuple[str, ...]:
+    """
+    Reads the `method` column of an open CSV file.
+
+    Parameters:
+    - csv_file (file-like): The CSV file.
+
+    Returns:
+    - tuple[str, ...]: The non-empty method names, in file order.
+    """
+    rows = csv.reader(csv_file)
+    header = next(rows, None)
+    if header is None:
+        return ()
+    if "method" not in header:
+        raise KeyError("method")
+    # Only the `method` cell of each row is kept, without building a
+    # dictionary per row
+    column = header.index("method")
+    return tuple(
+        row[column] for row in rows if len(row) > column and row[column]
+    )
+
+
+def _parse_methods(source) -> tuple[tuple[str, ...], frozenset[str]]:
+    """
+    Reads the DataFrame methods listed in a CSV file.
+
+    Parameters:
+    - source (str or file-like): The CSV file, with a `method` column.
+
+    Returns:
+    - tuple: The methods in file order and the set of method names.
+    """
+    if isinstance(source, str):
+        with open(source, newline="", encoding="utf-8") as csv_file:
+            methods = _read_methods(csv_file)
+    else:
+        methods = _read_methods(source)
+    # Identifiers from `ast.parse` are interned; interning the names
+    # lets set lookups match them by identity before comparing text
+    methods_set = frozenset(sys.intern(method) for method in methods)
+    return methods, methods_set
+
+
+@functools.lru_cache(maxsize=16)
+def _load_methods(
+    path: str, mtime_ns: int
+) -> tuple[tuple[str, ...], frozenset[str]]:
+    """
+    Reads the DataFrame methods of a CSV file once per version of the file.
+    The result is shared by every extractor loading the same file.
+
+    Parameters:
+    - path (str): Path to the CSV file.
+    - mtime_ns (int): Modification time of the file; a change of the file
+      leads to a new entry instead of a stale one.
+
+    Returns:
+    - tuple: The methods in file order and the set of method names.
+    """
+    return _parse_methods(path)
 
 
 class DataFrameExtractor:
@@ -19,8 +100,11 @@ class DataFrameExtractor:
         Instance Variables:
         - self.df_methods (list[str]): A list of Pandas DataFrame methods
           loaded from the CSV file.
+        - self.df_methods_set (frozenset[str]): The same methods, for
+          constant-time membership checks.
         """
         self.df_methods = []
+        self.df_methods_set = frozenset()
         if df_dict_path:
             self.load_dataframe_dict(df_dict_path)
 
@@ -29,13 +113,22 @@ class DataFrameExtractor:
         Loads a dictionary of Pandas DataFrame methods from a CSV file.
 
         Parameters:
-        - path (str): Path to the CSV file.
+        - path (str): Path to the CSV file, or an open file-like object.
 
         Returns:
-        - None: Updates `self.df_methods` with a list of method names.
+        - None: Updates `self.df_methods` with a list of method names
+          and `self.df_methods_set` with the same names.
         """
-        df = pd.read_csv(path, dtype={"method": "string"})
-        self.df_methods = df["method"].tolist()
+        if isinstance(path, (str, os.PathLike)):
+            path = os.fspath(path)
+            methods, methods_set = _load_methods(
+                path, os.stat(path).st_mtime_ns
+            )
+        else:
+            # File-like objects cannot be told apart, so they are not cached
+            methods, methods_set = _parse_methods(path)
+        self.df_methods = list(methods)
+        self.df_methods_set = methods_set
 
     def extract_dataframe_variables(
         self, fun_node: ast.AST, alias: str
@@ -51,62 +144,38 @@ class DataFrameExtractor:
         Returns:
         - list[str]: A list of variable names identified as DataFrames.
         """
-        dataframe_vars = []
-
-        # Include function parameters
-        if isinstance(fun_node, ast.FunctionDef):
-            for param in getattr(fun_node.args, "args", []):
-                if isinstance(param, ast.arg):
-                    dataframe_vars.append(param.arg)
+        dataframe_vars = self._function_parameters(fun_node)
 
         # Include variables assigned as DataFrames
-        for node in ast.walk(fun_node):
-            if isinstance(node, ast.Assign):
-
-                if isinstance(node.value, ast.Call):
-                    func = node.value.func
-                    if (
-                        isinstance(func, ast.Attribute)
-                        and isinstance(func.value, ast.Name)
-                        and func.value.id == alias
-                        and func.attr == "DataFrame"
-                    ):
-                        for target in node.targets:
-                            if isinstance(target, ast.Name):
-                                dataframe_vars.append(target.id)
-
-            # Derive new DataFrame variables from methods
-            if isinstance(node, ast.Assign):
-                if isinstance(node.value, ast.Call):
-                    func = node.value.func
-                    if (
-                        isinstance(func, ast.Attribute)
-                        and isinstance(func.value, ast.Name)
-                        and func.value.id in dataframe_vars
-                        and func.attr in self.df_methods
-                    ):
-                        for target in node.targets:
-                            if isinstance(target, ast.Name):
-                                dataframe_vars.append(target.id)
-
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        # If it's an assignment to a variable,
-                        # check if it is a DataFrame
-                        if isinstance(node.value, ast.Call) and isinstance(
-                            node.value.func, ast.Attribute
-                        ):
-                            if node.value.func.attr in self.df_methods:
-                                dataframe_vars.append(target.id)
-                        # Check for alias assignment
-                        elif (
-                            isinstance(node.value, ast.Name)
-                            and target.id != node.value.id
-                        ):
-                            # Handle aliasing of the DataFrame
-                            dataframe_vars.append(target.id)
-        return list(set(dataframe_vars))
+        for node in self._index_nodes(fun_node)[0]:
+            dataframe_vars.update(self._assigned_dataframes(node, alias))
+        return list(dataframe_vars)
+
+    def analyze(
+        self, fun_node: ast.AST, alias: str
+    ) -> tuple[list[str], dict[str, list[str]], dict[str, list[str]]]:
+        """
+        Extracts the DataFrame variables of a function together with the
+        methods called and the columns accessed on them, walking the
+        function only once.
+
+        Parameters:
+        - fun_node (ast.AST): The AST node representing a Python function.
+        - alias (str): The alias used for Pandas (e.g., "pd").
+
+        Returns:
+        - tuple: The DataFrame variable names, the methods called on each
+          of them and the columns accessed on each of them, as returned by
+          `extract_dataframe_variables`, `track_dataframe_methods` and
+          `track_dataframe_accesses`.
+        """
+        # All three steps read the same cached index of the function
+        dataframe_vars = self.extract_dataframe_variables(fun_node, alias)
+        return (
+            dataframe_vars,
+            self.track_dataframe_methods(fun_node, dataframe_vars),
+            self.track_dataframe_accesses(fun_node, dataframe_vars),
+        )
 
     def track_dataframe_methods(
         self, fun_node: ast.AST, dataframe_vars: list[str]
@@ -124,17 +193,19 @@ class DataFrameExtractor:
           and values are lists of method names called on those DataFrames.
         """
         methods_usage = {var: [] for var in dataframe_vars}
-        for node in ast.walk(fun_node):
-            if isinstance(node, ast.Call):  # Look for function/method calls
-                func = node.func
-                if isinstance(func, ast.Attribute) and isinstance(
-                    func.value, ast.Name
-                ):
-                    if (
-                        func.value.id in dataframe_vars
-                        and func.attr in self.df_methods
-                    ):
-                        methods_usage[func.value.id].append(func.attr)
+        df_methods = self.df_methods_set
+        # Look for function/method calls like `df.head()`; the checks run
+        # on every call, so they use exact type tests, cheapest first
+        for node in self._index_nodes(fun_node)[1]:
+            func = node.func
+            if type(func) is not _Attribute:
+                continue
+            value = func.value
+            if type(value) is not _Name:
+                continue
+            usage = methods_usage.get(value.id)
+            if usage is not None and func.attr in df_methods:
+                usage.append(func.attr)
         return methods_usage
 
     def track_dataframe_accesses(
@@ -150,19 +221,111 @@ class DataFrameExtractor:
         Returns:
         - dict[str, list[str]]: A dictionary
           where keys are DataFrame variable names,
-          and values are lists of column names accessed on those DataFrames.
-        """
-        accesses = {var: [] for var in dataframe_vars}
-        for node in ast.walk(fun_node):
-            if isinstance(
-                node, ast.Subscript
-            ):  # Look for subscript accesses (e.g., df['a'])
-                if (
-                    isinstance(node.value, ast.Name)
-                    and node.value.id in dataframe_vars
-                ):
-                    if isinstance(
-                        node.slice, ast.Constant
-                    ):  # Ensure the key is a constant
-                        accesses[node.value.id].append(node.slice.value)
-        return accesses
+          and values are the distinct column names accessed on those
+          DataFrames, in order of first access.
+        """
+        # Columns are collected as dict keys, so repeated accesses to the
+        # same column are stored once while keeping the access order
+        accesses = {var: {} for var in dataframe_vars}
+        # Look for subscript accesses with a constant key (e.g., df['a'])
+        for node in self._index_nodes(fun_node)[2]:
+            value = node.value
+            if type(value) is not _Name:
+                continue
+            columns = accesses.get(value.id)
+            if columns is not None and type(node.slice) is _Constant:
+                columns[node.slice.value] = None
+        return {var: list(columns) for var, columns in accesses.items()}
+
+    @staticmethod
+    def _index_nodes(
+        fun_node: ast.AST,
+    ) -> tuple[list[ast.Assign], list[ast.Call], list[ast.Subscript]]:
+        """
+        Returns the assignments, calls and subscripts within a function,
+        walking it only the first time it is seen.
+
+        Parameters:
+        - fun_node (ast.AST): The AST node representing a Python function.
+
+        Returns:
+        - tuple: The `ast.Assign`, `ast.Call` and `ast.Subscript` nodes.
+        """
+        index = _node_index.get(fun_node)
+        if index is None:
+            index = ([], [], [])
+            # An exact type lookup replaces a chain of isinstance checks
+            bucket_of = {
+                _Assign: index[0],
+                _Call: index[1],
+                _Subscript: index[2],
+            }.get
+            for node in ast.walk(fun_node):
+                bucket = bucket_of(type(node))
+                if bucket is not None:
+                    bucket.append(node)
+            _node_index[fun_node] = index
+        return index
+
+    @staticmethod
+    def _function_parameters(fun_node: ast.AST) -> set[str]:
+        """
+        Collects the parameter names of a function, which are
+        treated as potential DataFrames.
+
+        Parameters:
+        - fun_node (ast.AST): The AST node representing a Python function.
+
+        Returns:
+        - set[str]: The names of the positional parameters.
+        """
+        if not isinstance(fun_node, ast.FunctionDef):
+            return set()
+        return {
+            param.arg
+            for param in getattr(fun_node.args, "args", [])
+            if isinstance(param, ast.arg)
+        }
+
+    def _assigned_dataframes(self, node: ast.Assign, alias: str) -> list[str]:
+        """
+        Returns the variables an assignment binds to a DataFrame: the result
+        of `<alias>.DataFrame(...)` or of a DataFrame method, or another
+        variable being aliased.
+
+        Parameters:
+        - node (ast.Assign): The assignment to check.
+        - alias (str): The alias used for Pandas (e.g., "pd").
+
+        Returns:
+        - list[str]: The names of the assigned variables.
+        """
+        # Every attribute is read once into a local; the checks run on
+        # every assignment of every function
+        value = node.value
+        value_type = type(value)
+        if value_type is _Call:
+            func = value.func
+            if type(func) is not _Attribute:
+                return []
+            attr = func.attr
+            if attr not in self.df_methods_set:
+                if attr != "DataFrame":
+                    return []
+                base = func.value
+                if type(base) is not _Name or base.id != alias:
+                    return []
+            return [
+                target.id
+                for target in node.targets
+                if type(target) is _Name
+            ]
+        if value_type is _Name:
+            # Handle aliasing of the DataFrame
+            source = value.id
+            return [
+                target.id
+                for target in node.targets
+                if type(target) is _Name and target.id != source
+            ]
+        return []
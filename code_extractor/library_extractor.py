@@ -1,4 +1,12 @@
 import ast
+from collections import deque
+
+# Nodes that can hold statements; imports never appear inside expressions
+_STATEMENT_HOLDERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+# Import node types, bound once for exact `type(node) is` checks
+_Import = ast.Import
+_ImportFrom = ast.ImportFrom
 
 
 class LibraryExtractor:
@@ -7,6 +15,19 @@ class LibraryExtractor:
     from Python code represented as an Abstract Syntax Tree (AST).
     """
 
+    def __init__(self):
+        """
+        Initializes the LibraryExtractor.
+
+        Instance Variables:
+        - self._aliases_source (dict[str, str]): The alias mapping the
+          reverse lookup was last built from.
+        - self._library_by_alias (dict[str, str]): Maps each alias back to
+          the first library using it.
+        """
+        self._aliases_source = None
+        self._library_by_alias = {}
+
     def extract_libraries(self, tree: ast.AST) -> list[dict[str, str]]:
         """
         Extracts all libraries imported in the given AST.
@@ -34,13 +55,13 @@ class LibraryExtractor:
             ]
         """
         libraries = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
+        for node in self._iter_imports(tree):
+            if type(node) is _Import:
                 for alias in node.names:
                     libraries.append(
                         {"name": alias.name, "alias": alias.asname}
                     )
-            elif isinstance(node, ast.ImportFrom):
+            else:  # ast.ImportFrom
                 module = node.module or ""  # Handle cases where module is None
                 for alias in node.names:
                     full_name = (
@@ -51,6 +72,31 @@ class LibraryExtractor:
                     )
         return libraries
 
+    @staticmethod
+    def _iter_imports(tree: ast.AST):
+        """
+        Yields the import statements of an AST in `ast.walk` order,
+        descending only into statements and never into expressions.
+
+        Parameters:
+        - tree (ast.AST): The AST of a Python module.
+
+        Returns:
+        - Iterator[ast.AST]: The `ast.Import` and `ast.ImportFrom` nodes.
+        """
+        todo = deque([tree])
+        while todo:
+            node = todo.popleft()
+            node_type = type(node)
+            if node_type is _Import or node_type is _ImportFrom:
+                yield node
+                continue
+            todo.extend(
+                child
+                for child in ast.iter_child_nodes(node)
+                if isinstance(child, _STATEMENT_HOLDERS)
+            )
+
     def get_library_aliases(
         self, libraries: list[dict[str, str]]
     ) -> dict[str, str]:
@@ -125,20 +171,39 @@ class LibraryExtractor:
           the base object (`pd`) to match it with a library.
         - Returns "Unknown" if the node does not clearly belong to any library.
         """
-        if isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Attribute):  # e.g., pd.read_csv
-                if isinstance(node.func.value, ast.Name):  # e.g., pd
-                    base_object = node.func.value.id
-                    for library, alias in aliases.items():
-                        if alias == base_object:
-                            return library
-            elif isinstance(
-                node.func, ast.Name
-            ):  # Direct function calls without attributes
-                func_name = node.func.id
-                for library, alias in aliases.items():
-                    if (
-                        alias == func_name
-                    ):  # The function name matches a library alias
-                        return library
-        return "Unknown"
+        if not isinstance(node, ast.Call):
+            return "Unknown"
+
+        if isinstance(node.func, ast.Attribute):  # e.g., pd.read_csv
+            if not isinstance(node.func.value, ast.Name):
+                return "Unknown"
+            base_object = node.func.value.id  # e.g., pd
+        elif isinstance(node.func, ast.Name):
+            # Direct function calls without attributes
+            base_object = node.func.id
+        else:
+            return "Unknown"
+
+        return self._reverse_aliases(aliases).get(base_object, "Unknown")
+
+    def _reverse_aliases(self, aliases: dict[str, str]) -> dict[str, str]:
+        """
+        Maps each alias to its library. The mapping is reused while the
+        same alias dictionary is passed, which is the case for every node
+        of a module.
+
+        Parameters:
+        - aliases (dict[str, str]): A mapping of library names
+          to their aliases (as returned by `get_library_aliases`).
+
+        Returns:
+        - dict[str, str]: The library of each alias; when several libraries
+          share an alias, the first one in `aliases` is kept.
+        """
+        if aliases is not self._aliases_source:
+            library_by_alias = {}
+            for library, alias in aliases.items():
+                library_by_alias.setdefault(alias, library)
+            self._library_by_alias = library_by_alias
+            self._aliases_source = aliases
+        return self._library_by_alias
@@ -1,7 +1,72 @@
+import functools
 import os
 import pandas as pd
 
 
+@functools.lru_cache(maxsize=16)
+def _read_model_dict(
+    path: str, mtime_ns: int
+) -> dict[str, tuple]:
+    """
+    Reads a model dictionary CSV once per version of the file. The result
+    is shared by every extractor loading the same file, so its columns
+    are kept as tuples.
+
+    Parameters:
+    - path (str): Path to the CSV file.
+    - mtime_ns (int): Modification time of the file; a change of the file
+      leads to a new entry instead of a stale one.
+
+    Returns:
+    - dict[str, tuple]: The columns of the CSV.
+
+    Raises:
+    - ValueError: If the CSV does not contain the expected columns.
+    """
+    df = pd.read_csv(path)
+    if "method" not in df.columns or "library" not in df.columns:
+        raise ValueError(
+            "Expected columns 'method' and"
+            f"'library' not found in {path}"
+        )
+    return {column: tuple(df[column].tolist()) for column in df}
+
+
+@functools.lru_cache(maxsize=16)
+def _read_tensor_operations_dict(
+    path: str, mtime_ns: int
+) -> dict[str, tuple]:
+    """
+    Reads a tensor operations CSV once per version of the file, keeping
+    only the operations with more than one tensor input. The result is
+    shared by every extractor loading the same file, so its columns are
+    kept as tuples.
+
+    Parameters:
+    - path (str): Path to the CSV file.
+    - mtime_ns (int): Modification time of the file; a change of the file
+      leads to a new entry instead of a stale one.
+
+    Returns:
+    - dict[str, tuple]: The columns of the filtered CSV.
+
+    Raises:
+    - ValueError: If the CSV does not contain the expected columns.
+    """
+    df = pd.read_csv(path)
+    if "number_of_tensors_input" not in df.columns:
+        raise ValueError(
+            "Expected column 'number_of_tensors_input'"
+            f"not found in {path}"
+        )
+
+    # One mask slices every column, without building a filtered DataFrame
+    mask = df["number_of_tensors_input"].to_numpy() > 1
+    return {
+        column: tuple(df[column].to_numpy()[mask].tolist()) for column in df
+    }
+
+
 class ModelExtractor:
     """
     A utility class for extracting information
@@ -32,6 +97,8 @@ class ModelExtractor:
         self.tensors_path = tensors_path
         self.model_dict = None
         self.tensor_operations_dict = None
+        self._pairs_source = None
+        self._library_method_pairs = frozenset()
 
     def load_model_dict(self) -> dict[str, list]:
         """
@@ -47,19 +114,17 @@ class ModelExtractor:
           `self.models_path` cannot be found.
         - ValueError: If the CSV does not contain the expected columns.
         """
-        if not os.path.exists(self.models_path):
+        # The stat of the cache key doubles as the existence check
+        try:
+            mtime_ns = os.stat(self.models_path).st_mtime_ns
+        except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"Model file not found: {self.models_path}"
-            )
-
-        df = pd.read_csv(self.models_path)
-        if "method" not in df.columns or "library" not in df.columns:
-            raise ValueError(
-                "Expected columns 'method' and"
-                f"'library' not found in {self.models_path}"
-            )
+            ) from e
 
-        self.model_dict = df.to_dict(orient="list")
+        # Each extractor gets its own lists; the cached columns stay intact
+        columns = _read_model_dict(self.models_path, mtime_ns)
+        self.model_dict = {key: list(value) for key, value in columns.items()}
         return self.model_dict
 
     def load_tensor_operations_dict(self) -> dict[str, list]:
@@ -81,20 +146,17 @@ class ModelExtractor:
           `self.tensors_path` cannot be found.
         - ValueError: If the CSV does not contain the expected columns.
         """
-        if not os.path.exists(self.tensors_path):
+        try:
+            mtime_ns = os.stat(self.tensors_path).st_mtime_ns
+        except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"Tensor operations file not found: {self.tensors_path}"
-            )
+            ) from e
 
-        df = pd.read_csv(self.tensors_path)
-        if "number_of_tensors_input" not in df.columns:
-            raise ValueError(
-                "Expected column 'number_of_tensors_input'"
-                f"not found in {self.tensors_path}"
-            )
-
-        tensors_df = df[df["number_of_tensors_input"] > 1]
-        self.tensor_operations_dict = tensors_df.to_dict(orient="list")
+        columns = _read_tensor_operations_dict(self.tensors_path, mtime_ns)
+        self.tensor_operations_dict = {
+            key: list(value) for key, value in columns.items()
+        }
         return self.tensor_operations_dict
 
     def load_model_methods(self) -> list[str]:
@@ -140,10 +202,20 @@ class ModelExtractor:
                 "Model dictionary not loaded. Call `load_model_dict` first."
             )
 
-        for lib, method in zip(
-            self.model_dict["library"], self.model_dict["method"]
-        ):
-            if lib in libraries and method == model:
-                return True
+        pairs = self._library_methods()
+        return any((lib, model) in pairs for lib in libraries)
+
+    def _library_methods(self) -> frozenset:
+        """
+        Returns the (library, method) pairs of the model dictionary, rebuilt
+        only when `self.model_dict` is replaced.
 
-        return False
+        Returns:
+        - frozenset: The (library, method) pair of each model.
+        """
+        if self._pairs_source is not self.model_dict:
+            self._library_method_pairs = frozenset(
+                zip(self.model_dict["library"], self.model_dict["method"])
+            )
+            self._pairs_source = self.model_dict
+        return self._library_method_pairs
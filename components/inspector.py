@@ -1,5 +1,6 @@
 import os
 import ast
+from collections import Counter
 import pandas as pd
 from code_extractor.library_extractor import LibraryExtractor
 from code_extractor.model_extractor import ModelExtractor
@@ -7,6 +8,16 @@ from code_extractor.dataframe_extractor import DataFrameExtractor
 from code_extractor.variable_extractor import VariableExtractor
 from components.rule_checker import RuleChecker
 
+# Columns of the detected-smell DataFrames, in output order
+RESULT_COLUMNS = (
+    "filename",
+    "function_name",
+    "smell_name",
+    "line",
+    "description",
+    "additional_info",
+)
+
 
 class Inspector:
     """
@@ -45,15 +56,25 @@ class Inspector:
         Returns:
         - pd.DataFrame: A DataFrame containing detected code smells.
         """
-        col = [
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ]
-        to_save = pd.DataFrame(columns=col)
+        return pd.DataFrame(
+            self.inspect_records(filename), columns=RESULT_COLUMNS
+        )
+
+    def inspect_records(self, filename: str) -> list[dict[str, any]]:
+        """
+        Inspects a file for code smells like `inspect`, returning the
+        detected smells as plain rows so that callers can gather the rows
+        of many files and build a single DataFrame.
+
+        Parameters:
+        - filename (str): The name of the file to analyze.
+
+        Returns:
+        - list[dict[str, any]]: One row per detected smell, keyed by the
+          names in `RESULT_COLUMNS`.
+        """
+        # Rows of every function are collected across the whole file
+        rows = []
         file_path = os.path.abspath(filename)
 
         try:
@@ -64,6 +85,21 @@ class Inspector:
             tree = ast.parse(source)
             lines = source.splitlines()
 
+            # The tree is walked once; the line map and the function list
+            # below are both built from the same list of nodes
+            all_nodes = list(ast.walk(tree))
+            function_defs = [
+                n for n in all_nodes if isinstance(n, ast.FunctionDef)
+            ]
+
+            # Map each line number to its source line once per file; it is
+            # shared by every function instead of being rebuilt for each one
+            lines_by_number = {
+                n.lineno: lines[n.lineno - 1]
+                for n in all_nodes
+                if hasattr(n, "lineno")
+            }
+
             # Step 1: Extract Libraries
             libraries = self.library_extractor.get_library_aliases(
                 self.library_extractor.extract_libraries(tree)
@@ -72,62 +108,61 @@ class Inspector:
             # Step 2: Analyze Functions and Extract Variables
             variables_by_function = {}
             dataframe_variables_by_function = {}
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    function_name = node.name
-                    variables_by_function[function_name] = (
-                        self.variable_extractor.extract_variable_definitions(
-                            node
-                        )
-                    )
-                    dataframe_variables_by_function[function_name] = (
-                        self.dataframe_extractor.extract_dataframe_variables(
-                            node, alias=libraries.get("pandas", None)
-                        )
+            # DataFrame variables are only read by smells that require
+            # pandas, which never run on files that do not import it
+            pandas_alias = libraries.get("pandas", None)
+            for node in function_defs:
+                function_name = node.name
+                variables_by_function[function_name] = (
+                    self.variable_extractor.extract_variable_definitions(node)
+                )
+                dataframe_variables_by_function[function_name] = (
+                    self.dataframe_extractor.extract_dataframe_variables(
+                        node, alias=pandas_alias
                     )
+                    if pandas_alias
+                    else []
+                )
 
             # Step 3: Load Dictionaries (preloaded during setup)
             models = self.model_extractor.model_dict
-            tensor_operations = self.model_extractor.tensor_operations_dict
-            dataframe_methods = self.dataframe_extractor.df_methods
+            dataframe_methods = self.dataframe_extractor.df_methods_set
 
             # Step 4: Rule Check on Each Function
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    try:
-                        function_data = {
-                            "libraries": libraries,
-                            "variables": variables_by_function[node.name],
-                            "lines": {
-                                n.lineno: lines[n.lineno - 1]
-                                for n in ast.walk(tree)
-                                if hasattr(n, "lineno")
-                            },
-                            "dataframe_methods": dataframe_methods,
-                            "dataframe_variables": (
-                                dataframe_variables_by_function[node.name]
-                            ),
-                            "tensor_operations": tensor_operations.get(
-                                "operation", []
-                            ),
-                            "models": {
-                                model: models[model] for model in models.keys()
-                            },
-                            "model_methods": (
-                                self.model_extractor.load_model_methods()
-                            ),
-                        }
-
-                        # Pass data to the Rule Checker
-                        to_save = self.rule_checker.rule_check(
-                            node, function_data, filename, node.name, to_save
-                        )
-                    except Exception as e:
-                        print(
-                            f"Error processing function '{node.name}' in file "
-                            f"'{filename}': {e}"
+            for node in function_defs:
+                try:
+                    function_nodes = list(ast.walk(node))
+                    function_data = {
+                        "libraries": libraries,
+                        "variables": variables_by_function[node.name],
+                        "lines": lines_by_number,
+                        "dataframe_methods": dataframe_methods,
+                        "dataframe_variables": (
+                            dataframe_variables_by_function[node.name]
+                        ),
+                        "tensor_operations": self.tensor_operations,
+                        "models": models,
+                        "model_methods": self.model_methods,
+                        "nodes": function_nodes,
+                        "attribute_counts": Counter(
+                            n.attr
+                            for n in function_nodes
+                            if isinstance(n, ast.Attribute)
+                        ),
+                    }
+
+                    # Pass data to the Rule Checker
+                    rows.extend(
+                        self.rule_checker.detect_smells(
+                            node, function_data, filename, node.name
                         )
-                        raise e
+                    )
+                except Exception as e:
+                    print(
+                        f"Error processing function '{node.name}' in file "
+                        f"'{filename}': {e}"
+                    )
+                    raise e
 
         except FileNotFoundError as e:
             print(f"Error: File '{filename}' not found. {e}")
@@ -139,7 +174,7 @@ class Inspector:
             print(f"Unexpected error while analyzing file '{filename}': {e}")
             raise e
 
-        return to_save
+        return rows
 
     def _setup(
         self,
@@ -172,3 +207,9 @@ class Inspector:
         self.model_extractor.load_model_dict()
         self.model_extractor.load_tensor_operations_dict()
         self.dataframe_extractor.load_dataframe_dict(dataframe_dict_path)
+
+        # Read-only lookups shared by every inspected file and function
+        self.tensor_operations = frozenset(
+            self.model_extractor.tensor_operations_dict.get("operation", [])
+        )
+        self.model_methods = self.model_extractor.load_model_methods()
@@ -1,11 +1,139 @@
+import logging
 import os
 import time
-import threading
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
-from components.inspector import Inspector
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from components.inspector import RESULT_COLUMNS, Inspector
 from utils.file_utils import FileUtils
 
+logger = logging.getLogger(__name__)
+
+# Inspector owned by each worker process of a parallel analysis
+_worker_inspector = None
+
+
+def _init_worker(inspector: Inspector):
+    """
+    Stores the Inspector a worker process uses for every file or project it
+    analyzes, so it is pickled once per worker instead of once per task.
+
+    Parameters:
+    - inspector (Inspector): The Inspector to use in this process.
+    """
+    global _worker_inspector
+    _worker_inspector = inspector
+
+
+def _inspect_file(inspector: Inspector, filename: str):
+    """
+    Inspects a single file, capturing the errors that
+    only skip the file instead of aborting the analysis.
+
+    Parameters:
+    - inspector (Inspector): The Inspector to run.
+    - filename (str): The file to analyze.
+
+    Returns:
+    - tuple: The detected smell rows (or None) and the error (or None).
+    """
+    try:
+        return inspector.inspect_records(filename), None
+    except (SyntaxError, FileNotFoundError) as e:
+        return None, e
+
+
+def _inspect_file_in_worker(filename: str):
+    """
+    Inspects a file with the Inspector of the current worker process.
+
+    Parameters:
+    - filename (str): The file to analyze.
+
+    Returns:
+    - tuple: The detected smell rows (or None) and the error (or None).
+    """
+    return _inspect_file(_worker_inspector, filename)
+
+
+def _collect_results(
+    filenames: list[str], outcomes, error_file_path: str
+) -> tuple[list[dict], int]:
+    """
+    Gathers the detected smells of inspected files and records the files
+    that failed. The error file is opened at most once per call.
+
+    Parameters:
+    - filenames (list[str]): The inspected files.
+    - outcomes (iterable): The smell rows (or None) and the error (or None)
+      of each file, in the order of `filenames`.
+    - error_file_path (str): File collecting the files that failed to parse.
+
+    Returns:
+    - tuple: The smell rows of all files and the total smell count.
+    """
+    results = []
+    smell_total = 0
+    error_file = None
+    try:
+        for filename, (result, error) in zip(filenames, outcomes):
+            if error is not None:
+                if error_file is None:
+                    error_file = open(error_file_path, "a")
+                error_file.write(f"Error in file {filename}: {str(error)}\n")
+                print(f"Error analyzing file: {filename} - {str(error)}")
+                continue
+
+            smell_count = len(result)
+            smell_total += smell_count
+            if smell_count > 0:
+                logger.debug(
+                    "Found %d code smells in file: %s", smell_count, filename
+                )
+                results.extend(result)
+    finally:
+        if error_file is not None:
+            error_file.close()
+
+    return results, smell_total
+
+
+def _analyze_project_in_worker(
+    dirname: str, project_path: str, error_file_path: str, details_path: str
+) -> int:
+    """
+    Analyzes one project of a parallel multi-project analysis with the
+    Inspector of the current worker process and saves its detailed results.
+
+    Parameters:
+    - dirname (str): Name of the project directory.
+    - project_path (str): Path to the project to be analyzed.
+    - error_file_path (str): File collecting the files that failed to parse.
+    - details_path (str): Existing directory receiving the per-project
+      results.
+
+    Returns:
+    - int: Number of code smells found in the project.
+    """
+    print(f"Analyzing project '{dirname}' in parallel...")
+    filenames = FileUtils.get_python_files(project_path)
+
+    results, project_smells = _collect_results(
+        filenames,
+        (_inspect_file(_worker_inspector, filename) for filename in filenames),
+        error_file_path,
+    )
+
+    if results:
+        detailed_file_path = os.path.join(
+            details_path, f"{dirname}_results.csv"
+        )
+        pd.DataFrame(results, columns=RESULT_COLUMNS).to_csv(
+            detailed_file_path, index=False
+        )
+        print(f"Detailed results saved to {detailed_file_path}")
+
+    return project_smells
+
 
 class ProjectAnalyzer:
     """
@@ -22,6 +150,9 @@ class ProjectAnalyzer:
         """
         self.base_output_path = output_path
         self.output_path = os.path.join(output_path, "output")
+        # Paths reused for every analyzed file and project
+        self.error_file_path = os.path.join(self.output_path, "error.txt")
+        self.details_path = os.path.join(self.output_path, "project_details")
 
         FileUtils.clean_directory(self.base_output_path, "output")
 
@@ -47,12 +178,14 @@ class ProjectAnalyzer:
         df.to_csv(file_path, index=False)
         print(f"Results saved to {file_path}")
 
-    def analyze_project(self, project_path: str) -> int:
+    def analyze_project(self, project_path: str, max_workers: int = 1) -> int:
         """
         Analyzes a single project for code smells.
 
         Parameters:
         - project_path (str): Path to the project to be analyzed.
+        - max_workers (int): Number of processes analyzing files in
+          parallel. With 1, files are analyzed in the current process.
 
         Returns:
         - int: Total number of code smells found in the project.
@@ -64,36 +197,19 @@ class ProjectAnalyzer:
         filenames = FileUtils.get_python_files(project_path)
         if not filenames:
             raise ValueError(f"The project '{project_path}' contains no Python files.")
-        col = [
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ]
-        to_save = pd.DataFrame(columns=col)
-        total_smells = 0
-
-        for filename in filenames:
-            try:
-                result = self.inspector.inspect(filename)
-
-                smell_count = len(result)
-                total_smells += smell_count
-                if smell_count > 0:
-                    print(
-                        f"Found {smell_count} code smells in file: {filename}"
-                    )
-                to_save = pd.concat([to_save, result], ignore_index=True)
-            except (SyntaxError, FileNotFoundError) as e:
-                error_file = os.path.join(self.output_path, "error.txt")
-                os.makedirs(self.output_path, exist_ok=True)
-                with open(error_file, "a") as f:
-                    f.write(f"Error in file {filename}: {str(e)}\n")
-                print(f"Error analyzing file: {filename} - {str(e)}")
-                continue
+        if max_workers > 1 and len(filenames) > 1:
+            outcomes = self._inspect_files_parallel(filenames, max_workers)
+        else:
+            outcomes = (
+                _inspect_file(self.inspector, filename)
+                for filename in filenames
+            )
+        results, total_smells = _collect_results(
+            filenames, outcomes, self.error_file_path
+        )
 
+        # The rows of every file are framed once
+        to_save = pd.DataFrame(results, columns=RESULT_COLUMNS)
         self._save_results(to_save, "overview.csv")
 
         print(f"Finished analysis for project: {project_name}")
@@ -103,6 +219,31 @@ class ProjectAnalyzer:
         )
         return total_smells
 
+    def _inspect_files_parallel(self, filenames: list[str], max_workers: int):
+        """
+        Inspects files across a pool of worker processes.
+
+        Parameters:
+        - filenames (list[str]): The files to analyze.
+        - max_workers (int): Maximum number of worker processes.
+
+        Returns:
+        - list[tuple]: The detected smell rows (or None) and the error
+          (or None) of each file, in the order of `filenames`.
+        """
+        # Several files per task keep the inter-process overhead low
+        chunksize = max(1, min(8, len(filenames) // (max_workers * 4)))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.inspector,),
+        ) as executor:
+            return list(
+                executor.map(
+                    _inspect_file_in_worker, filenames, chunksize=chunksize
+                )
+            )
+
     def analyze_projects_sequential(
         self, base_path: str, resume: bool = False
     ):
@@ -128,79 +269,51 @@ class ProjectAnalyzer:
 
         start_time = time.time()
         total_smells = 0
+        os.makedirs(self.details_path, exist_ok=True)
+
+        # The log stays open for the whole run; line buffering still
+        # flushes each finished project for `resume`
+        with FileUtils.open_log(execution_log_path) as log_file:
+            for dirname in FileUtils.get_project_dirs(base_path):
+                if resume and dirname <= last_project:
+                    continue
+
+                project_path = os.path.join(base_path, dirname)
+
+                print(f"Analyzing project '{dirname}' sequentially...")
+                try:
+                    filenames = FileUtils.get_python_files(project_path)
+
+                    results, project_smells = _collect_results(
+                        filenames,
+                        (
+                            _inspect_file(self.inspector, filename)
+                            for filename in filenames
+                        ),
+                        self.error_file_path,
+                    )
 
-        for dirname in os.listdir(base_path):
-            if dirname in {"output", "execution_log.txt"}:
-                continue
-
-            if resume and dirname <= last_project:
-                continue
-
-            project_path = os.path.join(base_path, dirname)
-
-            if not os.path.isdir(project_path):
-                continue
-
-            print(f"Analyzing project '{dirname}' sequentially...")
-            try:
-                filenames = FileUtils.get_python_files(project_path)
-
-                col = [
-                    "filename",
-                    "function_name",
-                    "smell_name",
-                    "line",
-                    "description",
-                    "additional_info",
-                ]
-                to_save = pd.DataFrame(columns=col)
-                project_smells = 0
-
-                for filename in filenames:
-                    try:
-                        result = self.inspector.inspect(filename)
-
-                        smell_count = len(result)
-                        project_smells += smell_count
-                        if smell_count > 0:
-                            print(
-                                f"Found {smell_count} code "
-                                f"smells in file: {filename}"
-                            )
-                        to_save = pd.concat(
-                            [to_save, result], ignore_index=True
+                    if results:
+                        detailed_file_path = os.path.join(
+                            self.details_path, f"{dirname}_results.csv"
                         )
-                    except (SyntaxError, FileNotFoundError) as e:
-                        error_file = os.path.join(
-                            self.output_path, "error.txt"
+                        pd.DataFrame(results, columns=RESULT_COLUMNS).to_csv(
+                            detailed_file_path, index=False
+                        )
+                        print(
+                            f"Detailed results saved to {detailed_file_path}"
                         )
-                        os.makedirs(self.output_path, exist_ok=True)
-                        with open(error_file, "a") as f:
-                            f.write(f"Error in file {filename}: {str(e)}\n")
-                        print(f"Error analyzing file: {filename} - {str(e)}")
-                        continue
 
-                if not to_save.empty:
-                    details_path = os.path.join(
-                        self.output_path, "project_details"
-                    )
-                    os.makedirs(details_path, exist_ok=True)
-                    detailed_file_path = os.path.join(
-                        details_path, f"{dirname}_results.csv"
+                    total_smells += project_smells
+                    print(
+                        f"Project '{dirname}' analyzed successfully."
+                        f"Code smells found: {project_smells}\n"
                     )
-                    to_save.to_csv(detailed_file_path, index=False)
-                    print(f"Detailed results saved to {detailed_file_path}")
-
-                total_smells += project_smells
-                print(
-                    f"Project '{dirname}' analyzed successfully."
-                    f"Code smells found: {project_smells}\n"
-                )
 
-                FileUtils.append_to_log(execution_log_path, dirname)
+                    FileUtils.write_to_log(log_file, dirname)
 
-            except Exception as e:
-                print(f"Error analyzing project '{dirname}': {str(e)}\n")
+                except Exception as e:
+                    print(f"Error analyzing project '{dirname}': {str(e)}\n")
 
         print(
             "Sequential execution completed in "
@@ -214,7 +327,7 @@ class ProjectAnalyzer:
 
         Parameters:
         - base_path (str): Directory containing projects to be analyzed.
-        - max_workers (int): Maximum number of parallel threads.
+        - max_workers (int): Maximum number of worker processes.
         """
         execution_log_path = os.path.join(base_path, "execution_log.txt")
         if not os.path.exists(base_path):
@@ -223,81 +336,42 @@ class ProjectAnalyzer:
         if not os.path.exists(execution_log_path):
             FileUtils.initialize_log(execution_log_path)
 
+        project_dirs = FileUtils.get_project_dirs(base_path)
+
         start_time = time.time()
         total_smells = 0
-        lock = threading.Lock()  # Thread-safe lock for logging
-
-        def analyze_and_count_smells(dirname: str):
-            nonlocal total_smells
-            project_path = os.path.join(base_path, dirname)
-            if dirname in {"output", "execution_log.txt"} or not os.path.isdir(
-                project_path
-            ):
-                return
-
-            print(f"Analyzing project '{dirname}' in parallel...")
-            try:
-                filenames = FileUtils.get_python_files(project_path)
-
-                col = [
-                    "filename",
-                    "function_name",
-                    "smell_name",
-                    "line",
-                    "description",
-                    "additional_info",
-                ]
-                to_save = pd.DataFrame(columns=col)
-                project_smells = 0
-
-                for filename in filenames:
+        # Created once here rather than by each worker
+        os.makedirs(self.details_path, exist_ok=True)
+
+        with FileUtils.open_log(execution_log_path) as log_file:
+            # Projects are analyzed in separate processes, since the analysis
+            # is CPU-bound; counts and the execution log are handled here
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.inspector,),
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _analyze_project_in_worker,
+                        dirname,
+                        os.path.join(base_path, dirname),
+                        self.error_file_path,
+                        self.details_path,
+                    ): dirname
+                    for dirname in project_dirs
+                }
+                for future in as_completed(futures):
+                    dirname = futures[future]
                     try:
-                        result = self.inspector.inspect(filename)
-
-                        smell_count = len(result)
-                        project_smells += smell_count
-                        if smell_count > 0:
-                            print(
-                                f"Found {smell_count} code "
-                                f"smells in file: {filename}"
-                            )
-                        to_save = pd.concat(
-                            [to_save, result], ignore_index=True
-                        )
-                    except (SyntaxError, FileNotFoundError) as e:
-                        error_file = os.path.join(
-                            self.output_path, "error.txt"
+                        total_smells += future.result()
+                    except Exception as e:
+                        print(
+                            f"Error analyzing project '{dirname}': {str(e)}\n"
                         )
-                        os.makedirs(self.output_path, exist_ok=True)
-                        with open(error_file, "a") as f:
-                            f.write(f"Error in file {filename}: {str(e)}\n")
-                        print(f"Error analyzing file: {filename} - {str(e)}")
                         continue
 
-                if not to_save.empty:
-                    details_path = os.path.join(
-                        self.output_path, "project_details"
-                    )
-                    os.makedirs(details_path, exist_ok=True)
-                    detailed_file_path = os.path.join(
-                        details_path, f"{dirname}_results.csv"
-                    )
-                    to_save.to_csv(detailed_file_path, index=False)
-                    print(f"Detailed results saved to {detailed_file_path}")
-
-                total_smells += project_smells
-
-                # Thread-safe log update
-                FileUtils.synchronized_append_to_log(
-                    execution_log_path, dirname, lock
-                )
-
-            except Exception as e:
-                print(f"Error analyzing project '{dirname}': {str(e)}\n")
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for dirname in os.listdir(base_path):
-                executor.submit(analyze_and_count_smells, dirname)
+                    FileUtils.write_to_log(log_file, dirname)
 
         print(
             "Parallel execution completed in "
@@ -311,6 +385,6 @@ class ProjectAnalyzer:
         projects into a single overview CSV in the root output folder.
         """
         FileUtils.merge_results(
-            input_dir=os.path.join(self.output_path, "project_details"),
+            input_dir=self.details_path,
             output_dir=self.output_path,
         )
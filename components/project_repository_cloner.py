@@ -1,5 +1,8 @@
 import os
+import shutil
+import subprocess
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 
 class ProjectRepositoryCloner:
@@ -12,6 +15,7 @@ class ProjectRepositoryCloner:
         self,
         base_path: str = "../input/projects/",
         repo_data_path: str = "../input/dataset/NICHE.csv",
+        max_workers: int = 8,
     ):
         """
         Initializes the ProjectRepositoryCloner with paths for projects and
@@ -21,9 +25,11 @@ class ProjectRepositoryCloner:
         - base_path (str): Base directory where repositories will be cloned.
         - repo_data_path (str): Path to the CSV file containing repository
           metadata.
+        - max_workers (int): Maximum number of repositories cloned at once.
         """
         self.base_path = base_path
         self.repo_data_path = repo_data_path
+        self.max_workers = max_workers
 
     def get_repo(self, repo_url: str):
         """
@@ -41,9 +47,33 @@ class ProjectRepositoryCloner:
         build_path = os.path.join(self.base_path, folder_url)
         build_path = os.path.abspath(build_path)
 
-        if not os.path.exists(build_path):
-            os.mkdir(build_path)
-        os.system(f"git clone https://github.com/{repo_url} {build_path}")
+        os.makedirs(build_path, exist_ok=True)
+        # Only the current sources are analyzed, so the history is skipped
+        subprocess.run(
+            [
+                "git",
+                "clone",
+                "--depth=1",
+                f"https://github.com/{repo_url}",
+                build_path,
+            ],
+            check=False,
+        )
+
+    def get_repos(self, repo_urls):
+        """
+        Clones several GitHub repositories concurrently. Cloning waits on
+        the network, so threads overlap the downloads.
+
+        Parameters:
+        - repo_urls (iterable[str]): The GitHub repository URLs
+          (e.g., 'username/repository_name').
+
+        Returns:
+        - None
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(self.get_repo, repo_urls))
 
     def filter_repos(
         self, df: pd.DataFrame, stars: int = 200, commits: int = 100
@@ -89,8 +119,7 @@ class ProjectRepositoryCloner:
         df = pd.read_csv(self.repo_data_path)
         df = self.filter_repos(df)
         df = self.debug_filter_repo(df)
-        for repo_url in df["GitHub_Repo"]:
-            self.get_repo(repo_url)
+        self.get_repos(df["GitHub_Repo"])
 
     def get_projects(self):
         """
@@ -101,8 +130,7 @@ class ProjectRepositoryCloner:
         """
         df = pd.read_csv(self.repo_data_path)
         df = self.filter_repos(df)
-        for repo_url in df["GitHub_Repo"]:
-            self.get_repo(repo_url)
+        self.get_repos(df["GitHub_Repo"])
 
     def clean(self):
         """
@@ -112,12 +140,7 @@ class ProjectRepositoryCloner:
         - None
         """
         projects_path = os.path.join(self.base_path, "projects")
-        if os.name == "nt":
-            if os.path.exists(projects_path):
-                os.system(f"rmdir /s /q {projects_path}")
-        else:
-            if os.path.exists(projects_path):
-                os.system(f"rm -r {projects_path}")
+        shutil.rmtree(projects_path, ignore_errors=True)
 
     def setup(self):
         """
@@ -127,8 +150,7 @@ class ProjectRepositoryCloner:
         - None
         """
         projects_path = os.path.join(self.base_path, "projects")
-        if not os.path.exists(projects_path):
-            os.makedirs(projects_path)
+        os.makedirs(projects_path, exist_ok=True)
 
     def execute(self):
         """
@@ -22,6 +22,39 @@ from detection_rules.generic import (
 )
 
 
+# Detectors keep no state between files (only caches keyed on their
+# inputs), so a single instance of each is shared by every RuleChecker
+# fmt: off
+_SMELLS = (
+    # API-Specific Smells
+    chain_indexing_smell.ChainIndexingSmell(),
+    dataframe_conversion_api_misused.DataFrameConversionAPIMisused(),
+    gradients_not_cleared_before_backward_propagation.
+    GradientsNotClearedSmell(),
+    matrix_multiplication_api_misused.MatrixMultiplicationAPIMisused(),
+    pytorch_call_method_misused.PyTorchCallMethodMisusedSmell(),
+    tensor_array_not_used.TensorArrayNotUsedSmell(),
+    # Generic Smells
+    broadcasting_feature_not_used.BroadcastingFeatureNotUsedSmell(),
+    columns_and_datatype_not_explicitly_set.
+    ColumnsAndDatatypeNotExplicitlySetSmell(),
+    deterministic_algorithm_option_not_used.
+    DeterministicAlgorithmOptionSmell(),
+    empty_column_misinitialization.
+    EmptyColumnMisinitializationSmell(),
+    hyperparameters_not_explicitly_set.
+    HyperparametersNotExplicitlySetSmell(),
+    in_place_apis_misused.InPlaceAPIsMisusedSmell(),
+    memory_not_freed.MemoryNotFreedSmell(),
+    merge_api_parameter_not_explicitly_set.
+    MergeAPIParameterNotExplicitlySetSmell(),
+    nan_equivalence_comparison_misused.
+    NanEquivalenceComparisonMisusedSmell(),
+    unnecessary_iteration.UnnecessaryIterationSmell(),
+)
+# fmt: on
+
+
 class RuleChecker:
     """
     Applies detection rules to Python code using Abstract Syntax Tree (AST)
@@ -60,18 +93,74 @@ class RuleChecker:
         Returns:
         - pd.DataFrame: The updated DataFrame containing detected smells.
         """
+        rows = self.detect_smells(
+            ast_node, extracted_data, filename, function_name
+        )
+        if not rows:
+            return df_output
+
+        # The rows are added in one step instead of one `.loc` per smell
+        detected = pd.DataFrame(rows, columns=df_output.columns)
+        if df_output.empty:
+            return detected
+        return pd.concat([df_output, detected], ignore_index=True)
+
+    def detect_smells(
+        self,
+        ast_node: ast.AST,
+        extracted_data: dict[str, any],
+        filename: str,
+        function_name: str,
+    ) -> list[dict[str, any]]:
+        """
+        Applies all registered smell detectors to the given AST node and
+        returns the detected smells as result rows.
+
+        Parameters:
+        - ast_node (ast.AST): The AST node to analyze.
+        - extracted_data (dict): Pre-extracted data
+        (e.g., libraries, variables, etc.).
+        - filename (str): The name of the file being analyzed.
+        - function_name (str): The name of the function node being analyzed.
+
+        Returns:
+        - list[dict[str, any]]: One row per detected smell.
+        """
+        rows = []
+        libraries = extracted_data.get("libraries", {})
+        # Names used in the function, collected on first need
+        referenced_names = None
         for smell in self.smells:
+            # Skip smells whose library is not imported by the file
+            if smell.required_library is not None and not libraries.get(
+                smell.required_library
+            ):
+                continue
+            # Skip smells that need the library alias when the function
+            # never mentions it
+            if smell.requires_alias_reference:
+                if referenced_names is None:
+                    referenced_names = self._referenced_names(
+                        ast_node, extracted_data
+                    )
+                if libraries[smell.required_library] not in referenced_names:
+                    continue
+            # Each smell is isolated, so one failing rule keeps the rows
+            # of the others
             try:
-                detected_smells = smell.detect(ast_node, extracted_data)
-                for detected_smell in detected_smells:
-                    df_output.loc[len(df_output)] = {
-                        "filename": filename,
-                        "function_name": function_name,
-                        "smell_name": detected_smell["name"],
-                        "line": detected_smell["line"],
-                        "description": detected_smell["description"],
-                        "additional_info": detected_smell["additional_info"],
-                    }
+                rows.extend(
+                    [
+                        {
+                            "filename": filename,
+                            "function_name": function_name,
+                            "smell_name": detected["name"],
+                            "line": detected["line"],
+                            "description": detected["description"],
+                            "additional_info": detected["additional_info"],
+                        }
+                        for detected in smell.detect(ast_node, extracted_data)
+                    ]
+                )
             except Exception as e:
                 print(
                     f"Error in rule checker '{type(smell).__name__}' "
@@ -79,38 +168,29 @@ class RuleChecker:
                     f"in file '{filename}': {e}"
                 )
 
-        return df_output
+        return rows
+
+    def _referenced_names(
+        self, ast_node: ast.AST, extracted_data: dict[str, any]
+    ) -> set[str]:
+        """
+        Collects the names read or written in the analyzed function.
+
+        Parameters:
+        - ast_node (ast.AST): The AST node being analyzed.
+        - extracted_data (dict): The data extracted for `ast_node`.
+
+        Returns:
+        - set[str]: The identifier of every `ast.Name` in the function.
+        """
+        nodes = extracted_data.get("nodes")
+        if nodes is None:
+            nodes = ast.walk(ast_node)
+        return {node.id for node in nodes if isinstance(node, ast.Name)}
 
     def _setup_smells(self) -> None:
         """
         Sets up the smells for the RuleChecker
-        by explicitly instantiating them.
+        from the detector instances created at import.
         """
-        # fmt: off
-        self.smells = [
-            # API-Specific Smells
-            chain_indexing_smell.ChainIndexingSmell(),
-            dataframe_conversion_api_misused.DataFrameConversionAPIMisused(),
-            gradients_not_cleared_before_backward_propagation.
-            GradientsNotClearedSmell(),
-            matrix_multiplication_api_misused.MatrixMultiplicationAPIMisused(),
-            pytorch_call_method_misused.PyTorchCallMethodMisusedSmell(),
-            tensor_array_not_used.TensorArrayNotUsedSmell(),
-            # Generic Smells
-            broadcasting_feature_not_used.BroadcastingFeatureNotUsedSmell(),
-            columns_and_datatype_not_explicitly_set.
-            ColumnsAndDatatypeNotExplicitlySetSmell(),
-            deterministic_algorithm_option_not_used.
-            DeterministicAlgorithmOptionSmell(),
-            empty_column_misinitialization.
-            EmptyColumnMisinitializationSmell(),
-            hyperparameters_not_explicitly_set.
-            HyperparametersNotExplicitlySetSmell(),
-            in_place_apis_misused.InPlaceAPIsMisusedSmell(),
-            memory_not_freed.MemoryNotFreedSmell(),
-            merge_api_parameter_not_explicitly_set.
-            MergeAPIParameterNotExplicitlySetSmell(),
-            nan_equivalence_comparison_misused.
-            NanEquivalenceComparisonMisusedSmell(),
-            unnecessary_iteration.UnnecessaryIterationSmell(),
-        ]
+        self.smells = list(_SMELLS)
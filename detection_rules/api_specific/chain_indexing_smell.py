@@ -13,6 +13,8 @@ class ChainIndexingSmell(Smell):
         df.loc[0, "a"]  # More explicit and efficient
     """
 
+    required_library = "pandas"
+
     def __init__(self):
         super().__init__(
             name="Chain_Indexing",
@@ -30,10 +32,11 @@ class ChainIndexingSmell(Smell):
         if not pandas_alias:
             return smells
 
-        dataframe_variables = extracted_data["dataframe_variables"]
+        # Set lookup for the per-node membership test below
+        dataframe_variables = set(extracted_data["dataframe_variables"])
 
         # Traverse the entire AST
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             # Check if the node is a chained indexing
             if (
                 isinstance(node, ast.Subscript)
@@ -13,6 +13,8 @@ class DataFrameConversionAPIMisused(Smell):
         Use NumPy arrays or other Pandas methods for conversion.
     """
 
+    required_library = "pandas"
+
     def __init__(self):
         super().__init__(
             name="dataframe_conversion_api_misused",
@@ -33,11 +35,16 @@ class DataFrameConversionAPIMisused(Smell):
         if not pandas_alias:
             return smells
 
+        # Skip functions that never access `values`
+        attribute_counts = extracted_data.get("attribute_counts")
+        if attribute_counts is not None and not attribute_counts["values"]:
+            return smells
+
         dataframe_variables = extracted_data.get("dataframe_variables", [])
         lines = extracted_data.get("lines", {})
 
         # Traverse the AST
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Attribute)
                 and node.attr == "values"  # Check for the `values` attribute
@@ -15,6 +15,8 @@ class GradientsNotClearedSmell(Smell):
         optimizer.backward()  # Proper sequence
     """
 
+    required_library = "torch"
+
     def __init__(self):
         super().__init__(
             name="gradients_not_cleared_before_backward_propagation",
@@ -35,12 +37,17 @@ class GradientsNotClearedSmell(Smell):
         if not torch_alias:
             return smells
 
+        # Loops are only rescanned when the function calls `backward`
+        attribute_counts = extracted_data.get("attribute_counts")
+        if attribute_counts is not None and not attribute_counts["backward"]:
+            return smells
+
         lines = extracted_data.get("lines", {})
 
         variables = extracted_data["variables"]
 
         # Traverse the AST to detect improper usage of gradients
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if isinstance(
                 node, (ast.For, ast.While)
             ):  # Look for loops (for/while)
@@ -62,8 +69,7 @@ class GradientsNotClearedSmell(Smell):
                         if (
                             subnode.func.attr == "backward"
                             and isinstance(subnode.func.value, ast.Name)
-                            and subnode.func.value.id
-                            in extracted_data["variables"]
+                            and subnode.func.value.id in variables
                             and not zero_grad_called
                         ):
                             # Extract the offending line for additional context
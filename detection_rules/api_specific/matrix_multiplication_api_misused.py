@@ -14,6 +14,9 @@ class MatrixMultiplicationAPIMisused(Smell):
         np.matmul([[1, 2], [3, 4]], [[5, 6], [7, 8]])
     """
 
+    required_library = "numpy"
+    requires_alias_reference = True
+
     def __init__(self):
         super().__init__(
             name="matrix_multiplication_api_misused",
@@ -32,9 +35,14 @@ class MatrixMultiplicationAPIMisused(Smell):
         if not numpy_alias:
             return smells
 
+        # Skip functions that never access `dot`
+        attribute_counts = extracted_data.get("attribute_counts")
+        if attribute_counts is not None and not attribute_counts["dot"]:
+            return smells
+
         lines = extracted_data.get("lines", {})
 
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if isinstance(node, ast.Call) and isinstance(
                 node.func, ast.Attribute
             ):
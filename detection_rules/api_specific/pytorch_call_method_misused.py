@@ -13,6 +13,8 @@ class PyTorchCallMethodMisusedSmell(Smell):
         self.net(x)  # Use the model's instance directly.
     """
 
+    required_library = "torch"
+
     def __init__(self):
         super().__init__(
             name="pytorch_call_method_misused",
@@ -34,7 +36,7 @@ class PyTorchCallMethodMisusedSmell(Smell):
 
         variable_names = set(extracted_data["variables"].keys())
 
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Call)
                 and isinstance(node.func, ast.Attribute)
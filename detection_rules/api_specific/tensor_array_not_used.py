@@ -8,6 +8,9 @@ class TensorArrayNotUsedSmell(Smell):
     instead of `tf.TensorArray` in TensorFlow.
     """
 
+    required_library = "tensorflow"
+    requires_alias_reference = True
+
     def __init__(self):
         super().__init__(
             name="tensor_array_not_used",
@@ -32,7 +35,7 @@ class TensorArrayNotUsedSmell(Smell):
         # Track tensor variables initialized with `tf.constant`
         tensor_constants = set()
         # First Pass: Detect `tf.constant` assignments and track the variable
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if isinstance(node, ast.Assign) and isinstance(
                 node.value, ast.Call
             ):
@@ -47,7 +50,9 @@ class TensorArrayNotUsedSmell(Smell):
                             tensor_constants.add(target.id)
 
         # Second Pass: Check if the tracked tensor is modified inside a loop
-        for node in ast.walk(ast_node):
+        nodes = self._function_nodes(ast_node, extracted_data)
+        in_loop = None
+        for node in nodes:
             if isinstance(node, ast.Assign) and isinstance(
                 node.value, ast.Call
             ):
@@ -72,8 +77,11 @@ class TensorArrayNotUsedSmell(Smell):
                         if var in tensor_constants
                     ]
 
-                    # Smell is only valid if inside a loop
-                    if modified_tensors and self._is_in_loop(node, ast_node):
+                    # Smell is only valid if inside a loop; the set of
+                    # loop-nested nodes is built once, on first need
+                    if modified_tensors and in_loop is None:
+                        in_loop = self._nodes_in_loops(nodes)
+                    if modified_tensors and id(node) in in_loop:
                         smells.append(
                             self.format_smell(
                                 line=node.lineno,
@@ -118,24 +126,23 @@ class TensorArrayNotUsedSmell(Smell):
             return node.func.id
         return ""
 
-    def _is_in_loop(self, node: ast.AST, root_node: ast.AST) -> bool:
-        current = node
-        while current:
-            parent = self._find_parent_node(current, root_node)
-            if isinstance(
-                parent, (ast.For, ast.While)
-            ):  # Ensure loop is recognized
+    def _nodes_in_loops(self, nodes: list[ast.AST]) -> set[int]:
+        """
+        Collects the ids of every node nested inside a `for` or `while` loop.
 
-                return True
-            current = parent
-        return False
+        Parameters:
+        - nodes (list[ast.AST]): All AST nodes of the analyzed function.
 
-    def _find_parent_node(self, node: ast.AST, root_node: ast.AST) -> ast.AST:
+        Returns:
+        - set[int]: The `id()` of each node that has a loop as an ancestor.
         """
-        Finds the parent node of a given node within the AST.
-        """
-        for parent in ast.walk(root_node):
-            for child in ast.iter_child_nodes(parent):
-                if child == node:
-                    return parent
-        return None
+        in_loop = set()
+        for node in nodes:
+            # Nested loops are already covered by their outer loop
+            if (
+                isinstance(node, (ast.For, ast.While))
+                and id(node) not in in_loop
+            ):
+                for child in ast.iter_child_nodes(node):
+                    in_loop.update(id(sub) for sub in ast.walk(child))
+        return in_loop
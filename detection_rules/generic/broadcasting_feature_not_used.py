@@ -19,6 +19,8 @@ class BroadcastingFeatureNotUsedSmell(Smell):
         tensor_c = tensor_a + tensor_b  # Broadcasting applied
     """
 
+    required_library = "tensorflow"
+
     def __init__(self):
         super().__init__(
             name="Broadcasting_Feature_Not_Used",
@@ -40,27 +42,29 @@ class BroadcastingFeatureNotUsedSmell(Smell):
         if not tensorflow_alias:
             return smells
 
+        nodes = self._function_nodes(ast_node, extracted_data)
+
         # Identify variables created by tf.tile
-        tiled_variables = self._tensor_check_tiling(ast_node, tensorflow_alias)
+        tiled_variables = self._tensor_check_tiling(nodes, tensorflow_alias)
 
         # Check for arithmetic operations involving tiled variables
-        smells.extend(self._check_broadcasting(ast_node, tiled_variables))
+        smells.extend(self._check_broadcasting(nodes, tiled_variables))
 
         return smells
 
     def _tensor_check_tiling(
-        self, fun_node: ast.AST, tensorflow_alias: str
+        self, nodes: list[ast.AST], tensorflow_alias: str
     ) -> dict:
         """
         Identifies tensor variables that have undergone tiling operations.
 
-        :param fun_node: The AST node representing the function.
+        :param nodes: All AST nodes of the function.
         :param tensorflow_alias: Alias used for
                TensorFlow in the code (e.g., "tf").
         :return: Dictionary mapping tiled variable names to their AST nodes.
         """
         tiled_variables = {}
-        for node in ast.walk(fun_node):
+        for node in nodes:
             if (
                 isinstance(node, ast.Assign)
                 and isinstance(node.value, ast.Call)
@@ -74,10 +78,10 @@ class BroadcastingFeatureNotUsedSmell(Smell):
         return tiled_variables
 
     def _check_broadcasting(
-        self, fun_node: ast.AST, tiled_variables: dict
+        self, nodes: list[ast.AST], tiled_variables: dict
     ) -> list[dict]:
         smells = []
-        for node in ast.walk(fun_node):
+        for node in nodes:
             if isinstance(
                 node, ast.BinOp
             ):  # Arithmetic operation (e.g., +, -, *, /)
@@ -16,6 +16,12 @@ class ColumnsAndDatatypeNotExplicitlySetSmell(Smell):
         pd.read_csv("file.csv", dtype={"column1": "int", "column2": "float"})
     """
 
+    required_library = "pandas"
+    requires_alias_reference = True
+
+    # Pandas constructors and readers whose calls are checked
+    CHECKED_METHODS = frozenset({"DataFrame", "read_csv"})
+
     def __init__(self):
         super().__init__(
             name="columns_and_datatype_not_explicitly_set",
@@ -37,17 +43,16 @@ class ColumnsAndDatatypeNotExplicitlySetSmell(Smell):
             return smells
 
         # Traverse AST to find calls to DataFrame or read_csv
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Call)
                 and hasattr(node.func, "attr")
-                and node.func.attr
-                in {"DataFrame", "read_csv"}  # Specific methods to check
+                and node.func.attr in self.CHECKED_METHODS
                 and hasattr(node.func.value, "id")
                 and node.func.value.id == pandas_alias
             ):
                 # Check for missing or incomplete keyword arguments
-                if not hasattr(node, "keywords") or not node.keywords:
+                if not node.keywords:
                     smells.append(
                         self.format_smell(
                             line=node.lineno,
@@ -59,11 +64,7 @@ class ColumnsAndDatatypeNotExplicitlySetSmell(Smell):
                     )
                 else:
                     # Check if 'dtype' is explicitly set
-                    has_dtype = any(
-                        kw.arg == "dtype"
-                        for kw in node.keywords
-                        if isinstance(kw, ast.keyword)
-                    )
+                    has_dtype = any(kw.arg == "dtype" for kw in node.keywords)
                     if not has_dtype:
                         smells.append(
                             self.format_smell(
@@ -36,16 +36,16 @@ class DeterministicAlgorithmOptionSmell(Smell):
         libraries = extracted_data.get("libraries", {})
 
         # Traverse AST to detect calls to `use_deterministic_algorithms`
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if isinstance(node, ast.Call):
                 # Extract the full function name
                 func_name = self._get_full_function_name(node.func, libraries)
 
                 # Match the function name with the target method
-                if func_name in [
+                if func_name in {
                     "torch.use_deterministic_algorithms",
                     "use_deterministic_algorithms",
-                ]:
+                }:
                     if (
                         len(node.args) == 1
                         and isinstance(node.args[0], ast.Constant)
@@ -62,32 +62,3 @@ class DeterministicAlgorithmOptionSmell(Smell):
                         )
 
         return smells
-
-    def _get_full_function_name(self, func: ast.AST, libraries: dict) -> str:
-        """
-        Extracts the full name of a function or method from an AST node,
-        handling library aliases.
-
-        Parameters:
-        - func: The AST node representing the function or method.
-        - libraries: Dictionary of library aliases from extracted_data.
-
-        Returns:
-        - str: The full name of the function
-          (e.g., "torch.use_deterministic_algorithms").
-        """
-        names = []
-        while isinstance(func, ast.Attribute):
-            names.append(func.attr)
-            func = func.value
-
-        if isinstance(func, ast.Name):
-            # Handle aliases for libraries
-            if func.id in libraries.values():
-                alias = next(
-                    key for key, value in libraries.items() if value == func.id
-                )
-                names.append(alias)
-            else:
-                names.append(func.id)
-        return ".".join(reversed(names))
@@ -17,6 +17,8 @@ class EmptyColumnMisinitializationSmell(Smell):
         # Use NaN for better handling of empty values.
     """
 
+    required_library = "pandas"
+
     def __init__(self):
         super().__init__(
             name="empty_column_misinitialization",
@@ -36,13 +38,13 @@ class EmptyColumnMisinitializationSmell(Smell):
         if not pandas_alias:
             return smells
 
-        # Ensure dataframe_variables is always a list
-        dataframe_variables = extracted_data.get("dataframe_variables", [])
-        if dataframe_variables is None:
-            dataframe_variables = []
+        # Ensure dataframe_variables is always a set
+        dataframe_variables = set(
+            extracted_data.get("dataframe_variables") or ()
+        )
 
         # Traversing AST nodes to detect smells
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Assign)  # An assignment statement
                 and len(node.targets) == 1  # Single assignment target
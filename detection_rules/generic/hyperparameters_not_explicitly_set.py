@@ -22,6 +22,9 @@ class HyperparametersNotExplicitlySetSmell(Smell):
                 "models to ensure clarity and reproducibility."
             ),
         )
+        # Normalized model methods and the list they were computed from
+        self._model_methods_source = None
+        self._normalized_model_methods = frozenset()
 
     def detect(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
@@ -36,13 +39,12 @@ class HyperparametersNotExplicitlySetSmell(Smell):
         if not libraries:
             return smells
 
-        # Normalize model method names (remove '()' if present)
-        normalized_model_methods = [
-            method.replace("()", "") for method in model_methods
-        ]
+        normalized_model_methods = self._normalize_model_methods(
+            model_methods
+        )
 
         # Traverse AST to find calls to model definitions
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if isinstance(node, ast.Call):
                 # Extract the full function name
                 func_name = self._get_full_function_name(node.func, libraries)
@@ -65,31 +67,21 @@ class HyperparametersNotExplicitlySetSmell(Smell):
 
         return smells
 
-    def _get_full_function_name(self, func: ast.AST, libraries: dict) -> str:
+    def _normalize_model_methods(self, model_methods: list[str]) -> frozenset:
         """
-        Extracts the full name of a function or method from
-        an AST node, handling library aliases.
+        Normalizes model method names by removing '()' if present.
+        The result is reused while the same list of methods is passed,
+        which is the case for every function of an analysis.
 
         Parameters:
-        - func: The AST node representing the function or method.
-        - libraries: Dictionary of library aliases from extracted_data.
+        - model_methods (list[str]): Model methods from extracted_data.
 
         Returns:
-        - str: The full name of the function
-          (e.g., "sklearn.ensemble.RandomForestClassifier").
+        - frozenset: The normalized method names.
         """
-        names = []
-        while isinstance(func, ast.Attribute):
-            names.append(func.attr)
-            func = func.value
-
-        if isinstance(func, ast.Name):
-            # Handle aliases for libraries
-            if func.id in libraries.values():
-                alias = next(
-                    key for key, value in libraries.items() if value == func.id
-                )
-                names.append(alias)
-            else:
-                names.append(func.id)
-        return ".".join(reversed(names))
+        if model_methods is not self._model_methods_source:
+            self._normalized_model_methods = frozenset(
+                method.replace("()", "") for method in model_methods
+            )
+            self._model_methods_source = model_methods
+        return self._normalized_model_methods
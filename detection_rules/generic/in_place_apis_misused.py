@@ -17,6 +17,8 @@ class InPlaceAPIsMisusedSmell(Smell):
           # Explicitly use in-place operation
     """
 
+    required_library = "pandas"
+
     def __init__(self):
         super().__init__(
             name="in_place_apis_misused",
@@ -42,8 +44,12 @@ class InPlaceAPIsMisusedSmell(Smell):
         dataframe_variables = extracted_data.get("dataframe_variables", [])
         dataframe_methods = extracted_data.get("dataframe_methods", [])
 
+        nodes = self._function_nodes(ast_node, extracted_data)
+        # Ids of the call results assigned to a variable, built on first need
+        assigned_values = None
+
         # Traverse AST nodes
-        for node in ast.walk(ast_node):
+        for node in nodes:
             # Identify calls like `df.method(...)`
             if (
                 isinstance(node, ast.Call)
@@ -75,9 +81,9 @@ class InPlaceAPIsMisusedSmell(Smell):
 
                 # Flag cases where "inplace" is
                 # not set and the result is not assigned
-                if inplace_flag is None and not self._is_assignment(
-                    node, ast_node
-                ):
+                if inplace_flag is None and assigned_values is None:
+                    assigned_values = self._assigned_values(nodes)
+                if inplace_flag is None and id(node) not in assigned_values:
                     smells.append(
                         self.format_smell(
                             line=node.lineno,
@@ -93,20 +99,16 @@ class InPlaceAPIsMisusedSmell(Smell):
 
         return smells
 
-    def _is_assignment(self, node: ast.Call, root_node: ast.AST) -> bool:
+    def _assigned_values(self, nodes: list[ast.AST]) -> set[int]:
         """
-        Determines if the result of a method call is assigned to a variable.
+        Collects the values that are directly assigned to a variable.
 
         Parameters:
-        - node: The method call node to check.
-        - root_node: The root AST node of the function or file.
+        - nodes (list[ast.AST]): All AST nodes of the function.
 
         Returns:
-        - bool: True if the method call result is assigned, False otherwise.
+        - set[int]: The `id()` of each node used as an assignment value.
         """
-        for parent in ast.walk(root_node):
-            if isinstance(parent, ast.Assign):
-                # Check if the current node is assigned to a variable
-                if parent.value is node:  # Direct assignment check
-                    return True
-        return False
+        return {
+            id(node.value) for node in nodes if isinstance(node, ast.Assign)
+        }
@@ -19,6 +19,9 @@ class MemoryNotFreedSmell(Smell):
             tf.keras.backend.clear_session()  # Free memory explicitly
     """
 
+    required_library = "tensorflow"
+    requires_alias_reference = True
+
     def __init__(self):
         super().__init__(
             name="memory_not_freed",
@@ -45,7 +48,7 @@ class MemoryNotFreedSmell(Smell):
         # Identify loops in the AST
         loop_nodes = [
             node
-            for node in ast.walk(ast_node)
+            for node in self._function_nodes(ast_node, extracted_data)
             if isinstance(node, (ast.For, ast.While))
         ]
 
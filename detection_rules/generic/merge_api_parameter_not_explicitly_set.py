@@ -14,6 +14,11 @@ class MergeAPIParameterNotExplicitlySetSmell(Smell):
         df1.merge(df2, how='inner', on='key', validate='one_to_one')
     """
 
+    required_library = "pandas"
+
+    # Keyword arguments every `merge` call is expected to set
+    REQUIRED_ARGS = frozenset({"how", "on", "validate"})
+
     def __init__(self):
         super().__init__(
             name="merge_api_parameter_not_explicitly_set",
@@ -38,7 +43,7 @@ class MergeAPIParameterNotExplicitlySetSmell(Smell):
         dataframe_variables = extracted_data.get("dataframe_variables", [])
 
         # Traverse AST nodes to find calls to `merge`
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if (
                 isinstance(node, ast.Call)
                 and hasattr(node.func, "attr")
@@ -61,37 +66,17 @@ class MergeAPIParameterNotExplicitlySetSmell(Smell):
 
                 if is_dataframe_call or is_pandas_call:
                     # Check for missing or incomplete parameters
-                    if not hasattr(node, "keywords") or not isinstance(
-                        node.keywords, list
-                    ):
+                    keyword_names = {kw.arg for kw in node.keywords}
+                    if not self.REQUIRED_ARGS <= keyword_names:
                         smells.append(
                             self.format_smell(
                                 line=node.lineno,
                                 additional_info=(
-                                    "Missing explicit parameters in `merge` "
-                                    "(e.g., 'how', 'on', 'validate')."
+                                    "Incomplete parameters in `merge`. "
+                                    "Consider specifying 'how', 'on', "
+                                    " and 'validate'."
                                 ),
                             )
                         )
-                    else:
-                        # Ensure keywords are valid before processing
-                        valid_keywords = [
-                            kw.arg
-                            for kw in node.keywords
-                            if isinstance(kw, ast.keyword)
-                            and kw.arg is not None
-                        ]
-                        required_args = {"how", "on", "validate"}
-                        if not required_args.issubset(set(valid_keywords)):
-                            smells.append(
-                                self.format_smell(
-                                    line=node.lineno,
-                                    additional_info=(
-                                        "Incomplete parameters in `merge`. "
-                                        "Consider specifying 'how', 'on', "
-                                        " and 'validate'."
-                                    ),
-                                )
-                            )
 
         return smells
@@ -17,6 +17,8 @@ class NanEquivalenceComparisonMisusedSmell(Smell):
         if np.isnan(value):  # Correct
     """
 
+    required_library = "numpy"
+
     def __init__(self):
         super().__init__(
             name="nan_equivalence_comparison_misused",
@@ -37,7 +39,7 @@ class NanEquivalenceComparisonMisusedSmell(Smell):
             return smells
 
         # Traverse AST nodes
-        for node in ast.walk(ast_node):
+        for node in self._function_nodes(ast_node, extracted_data):
             if isinstance(node, ast.Compare):
                 # Check if NaN is misused in equivalence comparison
                 if self._has_nan_comparison(node, library_name):
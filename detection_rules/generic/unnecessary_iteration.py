@@ -20,6 +20,8 @@ class UnnecessaryIterationSmell(Smell):
         Use vectorized Pandas operations (e.g., `df["column"] = df["value"]`).
     """
 
+    required_library = "pandas"
+
     def __init__(self):
         super().__init__(
             name="unnecessary_iteration",
@@ -49,7 +51,7 @@ class UnnecessaryIterationSmell(Smell):
 
         loop_nodes = [
             node
-            for node in ast.walk(ast_node)
+            for node in self._function_nodes(ast_node, extracted_data)
             if isinstance(node, (ast.For, ast.While))
         ]
 
@@ -8,6 +8,16 @@ class Smell(ABC):
     Provides a standardized interface for smell detection and formatting.
     """
 
+    # Library the analyzed file must import for the smell to apply,
+    # as named in `extracted_data["libraries"]`; None if there is no
+    # such requirement. Lets the RuleChecker skip the smell entirely.
+    required_library = None
+
+    # Whether the smell only matches code that names the alias of
+    # `required_library` inside the analyzed function (e.g. `tf.concat`).
+    # Lets the RuleChecker skip functions that never mention the alias.
+    requires_alias_reference = False
+
     def __init__(self, name: str, description: str):
         """
         Initializes a Smell instance with its name and description.
@@ -54,7 +64,7 @@ class Smell(ABC):
                 1: "import pandas as pd",
                 2: "df = pd.DataFrame({'a': [1, 2, 3]})"
             }
-        - `dataframe_methods` (list[str]): List of Pandas
+        - `dataframe_methods` (frozenset[str]): Set of Pandas
            methods identified in the code
             (e.g., ["drop", "rename", "merge"]).
         - `dataframe_variables` (list[str]): List of variable
@@ -63,7 +73,7 @@ class Smell(ABC):
             [
                 "df", "data"
             ]
-        - `tensor_operations` (list[str]): List of
+        - `tensor_operations` (frozenset[str]): Set of
             tensor operations found in the code
             (e.g., ["dot", "matmul", "transpose"]).
         - `models` (dict[str, dict]): Maps model names to
@@ -82,6 +92,13 @@ class Smell(ABC):
                 "tensorflow": ["fit", "evaluate", "predict"],
                 "sklearn": ["fit", "score"]
             }
+        - `nodes` (list[ast.AST]): Every node of the analyzed function,
+           in `ast.walk` order. Built once per function so that all
+           detectors share a single traversal.
+        - `attribute_counts` (Counter[str]): Number of attribute
+           accesses per attribute name in the function, e.g.
+           `{"values": 2, "dot": 1}`. Lets detectors skip functions
+           that never access the attribute they look for.
 
         Returns:
         - list[dict[str, any]]: A list of dictionaries,
@@ -90,6 +107,56 @@ class Smell(ABC):
         """
         pass
 
+    def _function_nodes(
+        self, ast_node: ast.AST, extracted_data: dict[str, any]
+    ) -> list[ast.AST]:
+        """
+        Returns every node of the analyzed function.
+
+        Reuses the `nodes` list precomputed for the function when it is
+        available, and walks `ast_node` otherwise.
+
+        Parameters:
+        - ast_node (ast.AST): The AST node being analyzed.
+        - extracted_data (dict[str, any]): The data extracted for `ast_node`.
+
+        Returns:
+        - list[ast.AST]: All nodes of `ast_node`, in `ast.walk` order.
+        """
+        nodes = extracted_data.get("nodes")
+        if nodes is None:
+            nodes = list(ast.walk(ast_node))
+        return nodes
+
+    def _get_full_function_name(self, func: ast.AST, libraries: dict) -> str:
+        """
+        Extracts the full name of a function or method from an AST node,
+        handling library aliases.
+
+        Parameters:
+        - func: The AST node representing the function or method.
+        - libraries: Dictionary of library aliases from extracted_data.
+
+        Returns:
+        - str: The full name of the function
+          (e.g., "torch.use_deterministic_algorithms").
+        """
+        names = []
+        while isinstance(func, ast.Attribute):
+            names.append(func.attr)
+            func = func.value
+
+        if isinstance(func, ast.Name):
+            # Handle aliases for libraries
+            if func.id in libraries.values():
+                alias = next(
+                    key for key, value in libraries.items() if value == func.id
+                )
+                names.append(alias)
+            else:
+                names.append(func.id)
+        return ".".join(reversed(names))
+
     def format_smell(
         self, line: int, additional_info: str = ""
     ) -> dict[str, any]:
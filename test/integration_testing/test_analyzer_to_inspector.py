@@ -22,18 +22,16 @@ def test_project_analyzer_calls_inspect(
     mock_inspector_class, project_analyzer_setup
 ):
     mock_instance = Mock()
-    mock_instance.inspect.return_value = pd.DataFrame(
-        [
-            {
-                "filename": "test_file1.py",
-                "function_name": "main",
-                "smell_name": "TestSmell",
-                "line": 1,
-                "description": "Mocked smell",
-                "additional_info": "None",
-            }
-        ]
-    )
+    mock_instance.inspect_records.return_value = [
+        {
+            "filename": "test_file1.py",
+            "function_name": "main",
+            "smell_name": "TestSmell",
+            "line": 1,
+            "description": "Mocked smell",
+            "additional_info": "None",
+        }
+    ]
     mock_inspector_class.return_value = mock_instance
 
     input_path, output_path = project_analyzer_setup
@@ -46,7 +44,9 @@ def test_project_analyzer_calls_inspect(
         ((str(os.path.join(input_path, "test_file1.py")),),),
         ((str(os.path.join(input_path, "test_file2.py")),),),
     ]
-    mock_instance.inspect.assert_has_calls(expected_calls, any_order=True)
+    mock_instance.inspect_records.assert_has_calls(
+        expected_calls, any_order=True
+    )
 
     assert total_smells == 2
 
@@ -25,20 +25,18 @@ def process_data():
     return str(input_path), str(output_path)
 
 
-@patch("components.rule_checker.RuleChecker.rule_check")
-def test_full_integration_with_cli(mock_rule_check, integration_setup):
-    mock_rule_check.return_value = pd.DataFrame(
-        [
-            {
-                "filename": "test_file.py",
-                "function_name": "process_data",
-                "smell_name": "MockedSmell",
-                "line": 3,
-                "description": "Mocked smell detected",
-                "additional_info": "None",
-            }
-        ]
-    )
+@patch("components.rule_checker.RuleChecker.detect_smells")
+def test_full_integration_with_cli(mock_detect_smells, integration_setup):
+    mock_detect_smells.return_value = [
+        {
+            "filename": "test_file.py",
+            "function_name": "process_data",
+            "smell_name": "MockedSmell",
+            "line": 3,
+            "description": "Mocked smell detected",
+            "additional_info": "None",
+        }
+    ]
 
     input_path, output_path = integration_setup
 
@@ -27,22 +27,20 @@ def process_data():
 
 
 @patch("gui.code_smell_detector_gui.TextBoxRedirect")
-@patch("components.rule_checker.RuleChecker.rule_check")
+@patch("components.rule_checker.RuleChecker.detect_smells")
 def test_full_integration_with_gui(
-    mock_rule_check, mock_textbox_redirect, integration_setup
+    mock_detect_smells, mock_textbox_redirect, integration_setup
 ):
-    mock_rule_check.return_value = pd.DataFrame(
-        [
-            {
-                "filename": "test_file.py",
-                "function_name": "process_data",
-                "smell_name": "MockedSmell",
-                "line": 3,
-                "description": "Mocked smell detected",
-                "additional_info": "None",
-            }
-        ]
-    )
+    mock_detect_smells.return_value = [
+        {
+            "filename": "test_file.py",
+            "function_name": "process_data",
+            "smell_name": "MockedSmell",
+            "line": 3,
+            "description": "Mocked smell detected",
+            "additional_info": "None",
+        }
+    ]
 
     mock_textbox_redirect.return_value.write = Mock()
 
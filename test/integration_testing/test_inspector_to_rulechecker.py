@@ -1,6 +1,5 @@
 import pytest
 from unittest.mock import patch
-import pandas as pd
 from components.inspector import Inspector
 
 
@@ -46,18 +45,16 @@ def test_inspector_to_rulechecker(
     }
     mock_model_extractor.return_value.model_dict = {}
 
-    mock_rule_checker.return_value.rule_check.return_value = pd.DataFrame(
-        [
-            {
-                "filename": "test_file.py",
-                "function_name": "main",
-                "smell_name": "MockedSmell",
-                "line": 3,
-                "description": "Mocked smell detected",
-                "additional_info": "None",
-            }
-        ]
-    )
+    mock_rule_checker.return_value.detect_smells.return_value = [
+        {
+            "filename": "test_file.py",
+            "function_name": "main",
+            "smell_name": "MockedSmell",
+            "line": 3,
+            "description": "Mocked smell detected",
+            "additional_info": "None",
+        }
+    ]
 
     inspector = Inspector(output_path="output")
 
@@ -71,7 +68,7 @@ def test_inspector_to_rulechecker(
 
     mock_model_extractor.return_value.load_model_dict.assert_called_once()
 
-    mock_rule_checker.return_value.rule_check.assert_called_once()
+    mock_rule_checker.return_value.detect_smells.assert_called_once()
 
     assert not result.empty
     assert "smell_name" in result.columns
@@ -259,3 +259,27 @@ def test_execute_with_invalid_max_walkers_and_parallel(mock_analyzer):
         ValueError, match="max_walkers must be greater than 0."
     ):
         cli.execute()
+
+
+# Test that single-project parallel execution analyzes files in parallel
+def test_execute_single_project_parallel(mock_analyzer):
+    args = MagicMock()
+    args.input = "mock_input"
+    args.output = "mock_output"
+    args.parallel = True
+    args.resume = False
+    args.multiple = False
+    args.max_walkers = 3
+
+    mock_analyzer.analyze_project.return_value = 2
+
+    cli = CodeSmileCLI(args)
+    cli.analyzer = mock_analyzer
+
+    with patch("builtins.print"):
+        cli.execute()
+
+    mock_analyzer.analyze_project.assert_called_once_with(
+        "mock_input", max_workers=3
+    )
+    mock_analyzer.analyze_projects_parallel.assert_not_called()
@@ -6,90 +6,66 @@ from utils.file_utils import FileUtils
 
 
 @pytest.fixture
-def mock_file_system():
-    with patch("os.path.exists") as mock_exists, patch(
-        "os.makedirs"
-    ) as mock_makedirs, patch("os.listdir") as mock_listdir, patch(
-        "shutil.rmtree"
-    ) as mock_rmtree, patch(
-        "os.unlink"
-    ) as mock_unlink:
-        yield (
-            mock_exists,
-            mock_makedirs,
-            mock_listdir,
-            mock_rmtree,
-            mock_unlink,
-        )
-
-
-@pytest.fixture
-def mock_walk():
-    with patch("os.walk") as mock_walk:
-        yield mock_walk
-
-
-@pytest.fixture
-def mock_merge():
-    with patch("os.makedirs") as mock_makedirs, patch(
-        "os.walk"
-    ) as mock_walk, patch("pandas.read_csv") as mock_read_csv, patch(
-        "pandas.DataFrame.to_csv"
-    ) as mock_to_csv:
-        yield mock_makedirs, mock_walk, mock_read_csv, mock_to_csv
-
-
-def test_clean_directory(mock_file_system):
-    mock_exists, mock_makedirs, mock_listdir, mock_rmtree, mock_unlink = (
-        mock_file_system
-    )
-
-    # Case 1: Directory exists and has files
-    mock_exists.return_value = True
-    mock_listdir.return_value = ["file1.txt", "file2.txt"]
-
-    root_path = "mock/root"
+def python_tree(tmp_path):
+    # root/{file1.py, file2.txt}, root/subdir1/file3.py, root/subdir2/file4.py
+    for relative in [
+        "file1.py",
+        "file2.txt",
+        "subdir1/file3.py",
+        "subdir2/file4.py",
+    ]:
+        file_path = tmp_path / "root" / relative
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text("")
+    return tmp_path / "root"
+
+
+def test_clean_directory(tmp_path):
+    root_path = str(tmp_path)
     subfolder_name = "output"
+    output_path = tmp_path / subfolder_name
+
+    # Case 1: Directory exists and has files, a subdirectory and a symlink
+    (output_path / "nested").mkdir(parents=True)
+    (output_path / "nested" / "file3.txt").write_text("")
+    (output_path / "file1.txt").write_text("")
+    (output_path / "file2.txt").write_text("")
+    kept_dir = tmp_path / "kept"
+    kept_dir.mkdir()
+    (kept_dir / "file4.txt").write_text("")
+    os.symlink(kept_dir, output_path / "link")
 
     # Call the method
     cleaned_path = FileUtils.clean_directory(root_path, subfolder_name)
 
-    # Assert os.makedirs was not called
-    mock_makedirs.assert_not_called()
-
-    # Assert the method returns the correct path
+    # The directory is emptied but kept, and links are not followed
     assert cleaned_path == os.path.join(root_path, subfolder_name)
+    assert output_path.is_dir()
+    assert list(output_path.iterdir()) == []
+    assert (kept_dir / "file4.txt").exists()
 
     # Case 2: Directory does not exist
-    mock_exists.return_value = False
-    mock_listdir.return_value = []
+    output_path.rmdir()
 
     # Call the method again
     cleaned_path = FileUtils.clean_directory(root_path, subfolder_name)
 
-    # Assert os.makedirs was called to create the directory
-    mock_makedirs.assert_called_with(os.path.join(root_path, subfolder_name))
+    # The directory is created
+    assert output_path.is_dir()
     assert cleaned_path == os.path.join(root_path, subfolder_name)
 
 
-def test_get_python_files(mock_walk):
-    # Mock os.walk to simulate directory structure
-    mock_walk.return_value = [
-        ("root", ["subdir1", "subdir2"], ["file1.py", "file2.txt"]),
-        ("root/subdir1", [], ["file3.py"]),
-        ("root/subdir2", [], ["file4.py"]),
-    ]
-
-    path = "root"
+def test_get_python_files(python_tree):
+    path = str(python_tree)
 
     # Call the method
     python_files = FileUtils.get_python_files(path)
 
     # Calculate the expected absolute paths dynamically
     expected_files = [
-        os.path.abspath(os.path.join("root", "file1.py")),
-        os.path.abspath(os.path.join("root/subdir1", "file3.py")),
-        os.path.abspath(os.path.join("root/subdir2", "file4.py")),
+        os.path.abspath(os.path.join(path, "file1.py")),
+        os.path.abspath(os.path.join(path, "subdir1", "file3.py")),
+        os.path.abspath(os.path.join(path, "subdir2", "file4.py")),
     ]
 
     # Assert that only Python files are returned with absolute paths
@@ -98,40 +74,137 @@ def test_get_python_files(mock_walk):
     assert expected_files[1] in python_files
     assert expected_files[2] in python_files
     assert (
-        os.path.abspath(os.path.join("root", "file2.txt")) not in python_files
+        os.path.abspath(os.path.join(path, "file2.txt")) not in python_files
     )  # Non-Python file
 
 
-def test_merge_results(mock_merge):
-    mock_makedirs, mock_walk, mock_read_csv, mock_to_csv = mock_merge
+def test_get_python_files_skips_excluded_dirs(python_tree):
+    for skipped in ["venv", "lib", ".git", "__pycache__", "node_modules"]:
+        (python_tree / skipped).mkdir()
+        (python_tree / skipped / "hidden.py").write_text("")
+
+    python_files = FileUtils.get_python_files(str(python_tree))
 
-    # Mock os.walk to simulate the directory structure and files
-    mock_walk.return_value = [("mock_input", [], ["file1.csv", "file2.csv"])]
+    assert len(python_files) == 3
+    assert not any(f.endswith("hidden.py") for f in python_files)
+
+
+def test_get_python_files_custom_skip_dirs(python_tree):
+    (python_tree / "tests").mkdir()
+    (python_tree / "tests" / "test_file.py").write_text("")
+    path = str(python_tree)
+
+    assert len(FileUtils.get_python_files(path)) == 4
 
-    # Mock pandas read_csv for the two files
-    mock_read_csv.side_effect = [
-        pd.DataFrame({"filename": ["file1"], "data": [1]}),  # Not empty
-        pd.DataFrame({"filename": ["file2"], "data": [2]}),  # Not empty
+    python_files = FileUtils.get_python_files(
+        path, skip_dirs=frozenset({"tests", "subdir1"})
+    )
+
+    assert sorted(os.path.relpath(f, path) for f in python_files) == [
+        "file1.py",
+        os.path.join("subdir2", "file4.py"),
     ]
 
-    # Mock to_csv (no actual file writing will occur)
-    mock_to_csv.return_value = None
 
-    input_dir = "mock_input"
-    output_dir = "mock_output"
+def test_get_python_files_rescans_changed_dirs(python_tree):
+    path = str(python_tree)
+    assert len(FileUtils.get_python_files(path)) == 3
+
+    # A file added to a nested directory after the first scan is found
+    (python_tree / "subdir1" / "file5.py").write_text("")
+    python_files = FileUtils.get_python_files(path)
+
+    assert len(python_files) == 4
+    assert os.path.join(path, "subdir1", "file5.py") in python_files
+
+
+def test_get_project_dirs(tmp_path):
+    for name in ["project1", "project2", "output"]:
+        (tmp_path / name).mkdir()
+    (tmp_path / "execution_log.txt").write_text("")
+
+    project_dirs = FileUtils.get_project_dirs(str(tmp_path))
+
+    assert sorted(project_dirs) == ["project1", "project2"]
+
+
+def test_get_project_dirs_follows_symlinks(tmp_path):
+    base_path = tmp_path / "projects"
+    base_path.mkdir()
+    (base_path / "project1").mkdir()
+    (tmp_path / "elsewhere").mkdir()
+    os.symlink(tmp_path / "elsewhere", base_path / "linked_project")
+    os.symlink(tmp_path / "missing", base_path / "broken_link")
+
+    project_dirs = FileUtils.get_project_dirs(str(base_path))
+
+    assert sorted(project_dirs) == ["linked_project", "project1"]
+
+
+def test_merge_results(tmp_path):
+    input_dir = tmp_path / "mock_input"
+    output_dir = tmp_path / "mock_output"
+    input_dir.mkdir()
+
+    pd.DataFrame({"filename": ["file1"], "data": [1]}).to_csv(
+        input_dir / "file1.csv", index=False
+    )
+    pd.DataFrame({"filename": ["file2"], "data": [2]}).to_csv(
+        input_dir / "file2.csv", index=False
+    )
 
     # Call the method
-    FileUtils.merge_results(input_dir, output_dir)
+    FileUtils.merge_results(str(input_dir), str(output_dir))
+
+    # The merged file keeps a single header and every row
+    merged = pd.read_csv(output_dir / "overview.csv")
+    assert list(merged.columns) == ["filename", "data"]
+    assert sorted(merged["filename"]) == ["file1", "file2"]
+    assert sorted(merged["data"]) == [1, 2]
 
-    # Assert that makedirs was called for the output directory
-    mock_makedirs.assert_called_once_with(output_dir, exist_ok=True)
 
-    # Assert that to_csv was called to
-    # save the merged result to the correct file
-    mock_to_csv.assert_called_once_with(
-        os.path.join(output_dir, "overview.csv"), index=False
+def test_merge_results_skips_empty_csv(tmp_path):
+    input_dir = tmp_path / "mock_input"
+    output_dir = tmp_path / "mock_output"
+    input_dir.mkdir()
+
+    (input_dir / "empty.csv").write_text("filename,data\n")
+    pd.DataFrame({"filename": ["file1"], "data": [1]}).to_csv(
+        input_dir / "file1.csv", index=False
     )
 
+    FileUtils.merge_results(str(input_dir), str(output_dir))
+
+    merged = pd.read_csv(output_dir / "overview.csv")
+    assert merged["filename"].tolist() == ["file1"]
+
+
+def test_merge_results_skips_mismatched_header(tmp_path):
+    input_dir = tmp_path / "mock_input"
+    output_dir = tmp_path / "mock_output"
+    input_dir.mkdir()
+
+    (input_dir / "a.csv").write_bytes(b"filename,data\nfile1,1\n")
+    (input_dir / "b.csv").write_bytes(b"other,columns\nx,y\n")
+
+    FileUtils.merge_results(str(input_dir), str(output_dir))
+
+    # Files are merged in name order; "b.csv" does not match "a.csv"
+    merged = (output_dir / "overview.csv").read_bytes()
+    assert merged == b"filename,data\nfile1,1\n"
+
+
+def test_merge_results_no_valid_csv(tmp_path):
+    input_dir = tmp_path / "mock_input"
+    output_dir = tmp_path / "mock_output"
+    input_dir.mkdir()
+    (input_dir / "empty.csv").write_text("filename,data\n")
+
+    FileUtils.merge_results(str(input_dir), str(output_dir))
+
+    # Nothing is written when there are no rows to merge
+    assert not (output_dir / "overview.csv").exists()
+
 
 def test_initialize_log():
     log_path = "mock_log.txt"
@@ -158,6 +231,18 @@ def test_append_to_log():
         mock_file().write.assert_called_once_with("project1\n")
 
 
+def test_open_log_and_write_to_log(tmp_path):
+    log_path = tmp_path / "execution_log.txt"
+
+    with FileUtils.open_log(str(log_path)) as log_file:
+        FileUtils.write_to_log(log_file, "project1")
+        # Entries are flushed line by line, before the log is closed
+        assert log_path.read_text() == "project1\n"
+        FileUtils.write_to_log(log_file, "project2")
+
+    assert log_path.read_text() == "project1\nproject2\n"
+
+
 def test_get_last_logged_project():
     log_path = "mock_log.txt"
 
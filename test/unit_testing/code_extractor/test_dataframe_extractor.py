@@ -1,3 +1,4 @@
+import os
 import pytest
 import ast
 from io import StringIO
@@ -85,6 +86,25 @@ def parse_function(code):
 def test_load_dataframe_dict(extractor):
     """Test loading of DataFrame methods from a CSV."""
     assert extractor.df_methods == ["head", "merge"]
+    assert extractor.df_methods_set == frozenset({"head", "merge"})
+
+
+def test_load_dataframe_dict_from_path_is_cached(tmp_path):
+    """Test that a methods file is parsed once until it changes."""
+    path = tmp_path / "dataframes.csv"
+    path.write_text("method\nhead\nmerge\n")
+
+    first = dataframe_extractor.DataFrameExtractor(str(path))
+    second = dataframe_extractor.DataFrameExtractor(str(path))
+    assert second.df_methods == ["head", "merge"]
+    assert second.df_methods_set is first.df_methods_set
+
+    path.write_text("method\nhead\nmerge\ndrop\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    third = dataframe_extractor.DataFrameExtractor(str(path))
+    assert third.df_methods == ["head", "merge", "drop"]
 
 
 def test_extract_dataframe_variables(extractor, sample_code):
@@ -124,6 +144,24 @@ def test_track_dataframe_accesses(extractor, sample_code):
     assert accesses == {"df": ["a"], "other_df": [], "result": []}
 
 
+def test_analyze_matches_separate_passes(extractor, sample_code):
+    """Test that the single-pass analysis matches the separate methods."""
+    function_node = parse_function(sample_code)
+    dataframe_vars, method_usage, accesses = extractor.analyze(
+        function_node, alias="pd"
+    )
+
+    assert sorted(dataframe_vars) == sorted(
+        extractor.extract_dataframe_variables(function_node, alias="pd")
+    )
+    assert method_usage == extractor.track_dataframe_methods(
+        function_node, dataframe_vars
+    )
+    assert accesses == extractor.track_dataframe_accesses(
+        function_node, dataframe_vars
+    )
+
+
 def test_empty_function(extractor, empty_function_code):
     """Test with an empty function node."""
     function_node = parse_function(empty_function_code)
@@ -174,6 +212,22 @@ def test_no_pandas_alias(extractor, no_pandas_alias_code):
     assert dataframe_vars == []
 
 
+def test_repeated_column_accesses(extractor):
+    """Test that each accessed column is reported once, in access order."""
+    code = textwrap.dedent(
+        """
+        import pandas as pd
+        def repeated_access_function():
+            df = pd.DataFrame({'a': [1], 'b': [2]})
+            print(df['b'], df['a'], df['b'], df['a'])
+    """
+    )
+    function_node = parse_function(code)
+    accesses = extractor.track_dataframe_accesses(function_node, ["df"])
+
+    assert accesses == {"df": ["b", "a"]}
+
+
 def test_complex_subscript_access(extractor, complex_subscript_access_code):
     """Test for DataFrame accesses with non-constant keys."""
     function_node = parse_function(complex_subscript_access_code)
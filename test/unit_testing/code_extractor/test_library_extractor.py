@@ -101,6 +101,21 @@ def test_get_library_of_node_function_call(mocker, extractor):
     assert library_name == "pandas"
 
 
+def test_get_library_of_node_follows_alias_changes(mocker, extractor):
+    """Test that each alias mapping passed in is honored."""
+    node = ast.parse("np.array([1])").body[0].value
+
+    numpy_aliases = extractor.get_library_aliases(
+        [{"name": "numpy", "alias": "np"}]
+    )
+    assert extractor.get_library_of_node(node, numpy_aliases) == "numpy"
+
+    other_aliases = extractor.get_library_aliases(
+        [{"name": "pandas", "alias": "pd"}]
+    )
+    assert extractor.get_library_of_node(node, other_aliases) == "Unknown"
+
+
 def test_get_library_of_node_unknown(mocker, extractor):
     """
     Test getting 'Unknown' for a node
@@ -119,6 +134,37 @@ def test_get_library_of_node_unknown(mocker, extractor):
     assert library_name == "Unknown"
 
 
+def test_extract_libraries_nested_imports(mocker, extractor):
+    """Test that imports inside functions, classes and blocks are found."""
+    code = """
+import os
+
+try:
+    import torch
+except ImportError:
+    from tensorflow import keras
+
+def load():
+    import pandas as pd
+    return [x for x in range(3)]
+
+class Model:
+    def fit(self):
+        if True:
+            from sklearn import svm
+    """
+    tree = ast.parse(code)
+    libraries = extractor.extract_libraries(tree)
+
+    assert [lib["name"] for lib in libraries] == [
+        "os",
+        "torch",
+        "pandas",
+        "tensorflow.keras",
+        "sklearn.svm",
+    ]
+
+
 def test_extract_libraries_empty_code(mocker, extractor):
     """Test extracting libraries from empty code."""
     code = ""
@@ -1,5 +1,5 @@
+import os
 import pytest
-from unittest.mock import MagicMock
 import pandas as pd
 from code_extractor.model_extractor import ModelExtractor
 
@@ -10,88 +10,111 @@ def extractor():
     return ModelExtractor("models.csv", "tensors.csv")
 
 
-def test_load_model_dict(mocker, extractor):
+def test_load_model_dict(tmp_path):
     """Test loading the model dictionary from a CSV file."""
-    # Setup mock
-    mock_exists = mocker.patch("os.path.exists", return_value=True)
-    mock_read_csv = mocker.patch("pandas.read_csv")
-    mock_df = MagicMock()
-    mock_df.columns = ["method", "library"]
-    mock_df.to_dict.return_value = {"method": ["method1"], "library": ["lib1"]}
-    mock_read_csv.return_value = mock_df
+    models_path = tmp_path / "models.csv"
+    models_path.write_text("method,library\nmethod1,lib1\n")
+    extractor = ModelExtractor(str(models_path), "tensors.csv")
 
     model_dict = extractor.load_model_dict()
 
     assert model_dict == {"method": ["method1"], "library": ["lib1"]}
-    mock_exists.assert_called_once_with("models.csv")
-    mock_read_csv.assert_called_once_with("models.csv")
+    assert extractor.model_dict is model_dict
 
 
-def test_load_model_dict_file_not_found(mocker, extractor):
+def test_load_model_dict_is_cached(mocker, tmp_path):
+    """Test that an unchanged model file is read only once."""
+    models_path = tmp_path / "models.csv"
+    models_path.write_text("method,library\nmethod1,lib1\n")
+    read_csv_spy = mocker.spy(pd, "read_csv")
+
+    first = ModelExtractor(str(models_path), "tensors.csv").load_model_dict()
+    second = ModelExtractor(str(models_path), "tensors.csv").load_model_dict()
+
+    assert first == second
+    read_csv_spy.assert_called_once_with(str(models_path))
+
+    # A changed file is read again
+    models_path.write_text("method,library\nmethod2,lib2\n")
+    os.utime(models_path, ns=(0, 0))
+    third = ModelExtractor(str(models_path), "tensors.csv").load_model_dict()
+
+    assert third == {"method": ["method2"], "library": ["lib2"]}
+
+
+def test_load_model_dict_copies_cached_columns(tmp_path):
+    """Test that changing one extractor's dictionary leaves others intact."""
+    models_path = tmp_path / "models.csv"
+    models_path.write_text("method,library\nmethod1,lib1\n")
+
+    first = ModelExtractor(str(models_path), "tensors.csv")
+    first.load_model_dict()
+    first.model_dict["method"].append("method2")
+    first.model_dict["library"] = ["lib2"]
+
+    second = ModelExtractor(str(models_path), "tensors.csv")
+    model_dict = second.load_model_dict()
+
+    assert model_dict == {"method": ["method1"], "library": ["lib1"]}
+    assert second.check_model_method("method1", ["lib1"])
+    assert not second.check_model_method("method2", ["lib1"])
+
+
+def test_load_model_dict_file_not_found(tmp_path):
     """Test that FileNotFoundError is raised when model file doesn't exist."""
-    mock_exists = mocker.patch(  # noqa: F841
-        "os.path.exists", return_value=False
-    )
+    models_path = str(tmp_path / "models.csv")
+    extractor = ModelExtractor(models_path, "tensors.csv")
 
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match="Model file not found"):
         extractor.load_model_dict()
 
 
-def test_load_model_dict_missing_columns(mocker, extractor):
+def test_load_model_dict_missing_columns(tmp_path):
     """Test that ValueError is raised if the expected columns are missing."""
-    mock_exists = mocker.patch(  # noqa: F841
-        "os.path.exists", return_value=True
-    )
-    mock_read_csv = mocker.patch("pandas.read_csv")
-    mock_df = MagicMock()
-    mock_df.columns = ["other_column"]
-    mock_read_csv.return_value = mock_df
+    models_path = tmp_path / "models.csv"
+    models_path.write_text("other_column\nvalue\n")
+    extractor = ModelExtractor(str(models_path), "tensors.csv")
 
     with pytest.raises(ValueError):
         extractor.load_model_dict()
 
 
-def test_load_tensor_operations_dict(mocker, extractor):
+def test_load_tensor_operations_dict(tmp_path):
     """Test loading the tensor operations dictionary from a CSV file."""
-    mock_exists = mocker.patch("os.path.exists", return_value=True)
-
-    df = pd.DataFrame(
+    tensors_path = tmp_path / "tensors.csv"
+    pd.DataFrame(
         {"number_of_tensors_input": [2, 1], "operation": ["op1", "op2"]}
-    )
-    mock_read_csv = mocker.patch("pandas.read_csv", return_value=df)
+    ).to_csv(tensors_path, index=False)
+    extractor = ModelExtractor("models.csv", str(tensors_path))
 
     tensor_dict = extractor.load_tensor_operations_dict()
 
     expected_dict = {"number_of_tensors_input": [2], "operation": ["op1"]}
     assert tensor_dict == expected_dict
-    mock_exists.assert_called_once_with("tensors.csv")
-    mock_read_csv.assert_called_once_with("tensors.csv")
 
 
-def test_load_tensor_operations_dict_file_not_found(mocker, extractor):
+def test_load_tensor_operations_dict_file_not_found(tmp_path):
     """
     Test that FileNotFoundError is raised
     when tensor operations file doesn't exist.
     """
-    mock_exists = mocker.patch(  # noqa: F841
-        "os.path.exists", return_value=False
-    )
-    with pytest.raises(FileNotFoundError):
+    tensors_path = str(tmp_path / "tensors.csv")
+    extractor = ModelExtractor("models.csv", tensors_path)
+
+    with pytest.raises(
+        FileNotFoundError, match="Tensor operations file not found"
+    ):
         extractor.load_tensor_operations_dict()
 
 
-def test_load_tensor_operations_dict_missing_columns(mocker, extractor):
+def test_load_tensor_operations_dict_missing_columns(tmp_path):
     """
     Test that ValueError is raised if the
     expected columns are missing in tensor operations CSV.
     """
-    mock_exists = mocker.patch(  # noqa: F841
-        "os.path.exists", return_value=True
-    )
-    mock_read_csv = mocker.patch("pandas.read_csv")
-    mock_df = MagicMock()
-    mock_df.columns = ["other_column"]
-    mock_read_csv.return_value = mock_df
+    tensors_path = tmp_path / "tensors.csv"
+    tensors_path.write_text("other_column\nvalue\n")
+    extractor = ModelExtractor("models.csv", str(tensors_path))
 
     with pytest.raises(ValueError):
         extractor.load_tensor_operations_dict()
@@ -142,6 +165,17 @@ def test_check_model_method_not_in_library(mocker, extractor):
     assert result is False
 
 
+def test_check_model_method_follows_model_dict(mocker, extractor):
+    """Test that check_model_method uses a replaced model dictionary."""
+    extractor.model_dict = {"method": ["method1"], "library": ["lib1"]}
+    assert extractor.check_model_method("method1", ["lib1"]) is True
+
+    extractor.model_dict = {"method": ["method2"], "library": ["lib1"]}
+
+    assert extractor.check_model_method("method1", ["lib1"]) is False
+    assert extractor.check_model_method("method2", ["lib1"]) is True
+
+
 def test_check_model_method_not_loaded(mocker, extractor):
     """Test that ValueError is raised if model dictionary is not loaded."""
     with pytest.raises(ValueError):
@@ -74,34 +74,24 @@ def test_inspect(mock_inspector_dependencies):
         "method1": "details"
     }
 
-    mock_rule_checker.rule_check.return_value = pd.DataFrame(
-        data=[
-            [
-                "mock_file.py",
-                "my_function",
-                "smell1",
-                10,
-                "description1",
-                "info1",
-            ],
-            [
-                "mock_file.py",
-                "my_function",
-                "smell2",
-                15,
-                "description2",
-                "info2",
-            ],
-        ],
-        columns=[
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ],
-    )
+    mock_rule_checker.detect_smells.return_value = [
+        {
+            "filename": "mock_file.py",
+            "function_name": "my_function",
+            "smell_name": "smell1",
+            "line": 10,
+            "description": "description1",
+            "additional_info": "info1",
+        },
+        {
+            "filename": "mock_file.py",
+            "function_name": "my_function",
+            "smell_name": "smell2",
+            "line": 15,
+            "description": "description2",
+            "additional_info": "info2",
+        },
+    ]
 
     # Mock file contents
     mock_file_contents = """\
@@ -144,6 +134,7 @@ def my_function():
     # Instantiate the Inspector class
     inspector = Inspector(output_path="mock_output_path")
     inspector.rule_checker = mock_rule_checker
+    assert inspector.tensor_operations == {"tensor_op1", "tensor_op2"}
 
     # Call the `inspect` method
     result = inspector.inspect("mock_file.py")
@@ -153,7 +144,7 @@ def my_function():
         os.path.abspath("mock_file.py"), "r", encoding="utf-8"
     )
     mock_ast_parse.assert_called_once()
-    mock_rule_checker.rule_check.assert_called_once()
+    mock_rule_checker.detect_smells.assert_called_once()
 
     # Check result type and structure
     assert isinstance(result, pd.DataFrame)
@@ -166,4 +157,38 @@ def my_function():
         "additional_info",
     ]
     assert list(result.columns) == expected_columns
-    assert len(result) > 0
+    assert len(result) == 2
+
+
+def test_inspect_skips_dataframe_extraction_without_pandas(mocker, tmp_path):
+    source = tmp_path / "no_pandas.py"
+    source.write_text(
+        "import numpy as np\n\ndef my_function(x):\n    y = x\n    return y\n"
+    )
+    inspector = Inspector(output_path=str(tmp_path))
+    extract_spy = mocker.spy(
+        inspector.dataframe_extractor, "extract_dataframe_variables"
+    )
+
+    inspector.inspect(str(source))
+
+    # Only pandas smells read DataFrame variables, and none of them run
+    extract_spy.assert_not_called()
+
+
+def test_inspect_records_matches_inspect(tmp_path):
+    source = tmp_path / "chained.py"
+    source.write_text(
+        "import pandas as pd\n\n"
+        "def load():\n"
+        "    df = pd.DataFrame()\n"
+        "    df['a'][0] = 1\n"
+        "    return df\n"
+    )
+    inspector = Inspector(output_path=str(tmp_path))
+
+    records = inspector.inspect_records(str(source))
+
+    assert isinstance(records, list)
+    assert records
+    assert records == inspector.inspect(str(source)).to_dict("records")
@@ -2,7 +2,8 @@ import os
 import shutil
 import pytest
 import pandas as pd
-from unittest.mock import ANY, MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 from components.project_analyzer import ProjectAnalyzer
 
 
@@ -29,8 +30,10 @@ def mock_file_related_methods(monkeypatch):
     This fixture reduces repetition
     for mocking methods like os.path, FileUtils, etc.
     """
-    monkeypatch.setattr("os.path.isdir", lambda path: True)
-    monkeypatch.setattr("os.listdir", lambda path: ["project1", "project2"])
+    monkeypatch.setattr(
+        "utils.file_utils.FileUtils.get_project_dirs",
+        lambda path: ["project1", "project2"],
+    )
     monkeypatch.setattr(
         "utils.file_utils.FileUtils.get_python_files",
         lambda path: ["file1.py"],
@@ -38,9 +41,16 @@ def mock_file_related_methods(monkeypatch):
     monkeypatch.setattr(
         "utils.file_utils.FileUtils.initialize_log", lambda path: None
     )
+
+
+@pytest.fixture
+def in_process_executor(monkeypatch):
+    """
+    Fixture running the parallel analysis on threads of the test process,
+    so that mocked inspectors do not need to be pickled.
+    """
     monkeypatch.setattr(
-        "utils.file_utils.FileUtils.synchronized_append_to_log",
-        lambda path, project, lock: None,
+        "components.project_analyzer.ProcessPoolExecutor", ThreadPoolExecutor
     )
 
 
@@ -66,30 +76,30 @@ def test_analyze_project(
 
     # Mock inspection results for two files
     mock_inspection_results = [
-        pd.DataFrame(
+        [
             {
-                "filename": ["file1.py"],
-                "function_name": ["func1"],
-                "smell_name": ["smell1"],
-                "line": [10],
-                "description": ["desc1"],
-                "additional_info": ["info1"],
+                "filename": "file1.py",
+                "function_name": "func1",
+                "smell_name": "smell1",
+                "line": 10,
+                "description": "desc1",
+                "additional_info": "info1",
             }
-        ),
-        pd.DataFrame(
+        ],
+        [
             {
-                "filename": ["file2.py"],
-                "function_name": ["func2"],
-                "smell_name": ["smell2"],
-                "line": [20],
-                "description": ["desc2"],
-                "additional_info": ["info2"],
+                "filename": "file2.py",
+                "function_name": "func2",
+                "smell_name": "smell2",
+                "line": 20,
+                "description": "desc2",
+                "additional_info": "info2",
             }
-        ),
+        ],
     ]
 
-    # Mock inspect method to return the inspection results
-    project_analyzer.inspector.inspect = MagicMock(
+    # Mock inspect_records to return the inspection results
+    project_analyzer.inspector.inspect_records = MagicMock(
         side_effect=mock_inspection_results
     )
 
@@ -106,8 +116,8 @@ def test_analyze_project(
 
     # Assertions
     assert total_smells == 2  # Expecting 2 smells (from file1.py and file2.py)
-    project_analyzer.inspector.inspect.assert_any_call("file1.py")
-    project_analyzer.inspector.inspect.assert_any_call("file2.py")
+    project_analyzer.inspector.inspect_records.assert_any_call("file1.py")
+    project_analyzer.inspector.inspect_records.assert_any_call("file2.py")
 
     mock_project_path = "test/unit_testing/components/mock_project_path"
     if os.path.exists(mock_project_path):
@@ -133,16 +143,16 @@ def test_analyze_projects_sequential(
         ),
     )
 
-    # Mock the inspector's inspect method
-    mock_inspection_results = pd.DataFrame(
+    # Mock the inspector's inspect_records method
+    mock_inspection_results = [
         {
-            "filename": ["file1.py"],
-            "function_name": ["func1"],
-            "smell_name": ["smell1"],
-            "line": [10],
+            "filename": "file1.py",
+            "function_name": "func1",
+            "smell_name": "smell1",
+            "line": 10,
         }
-    )
-    project_analyzer.inspector.inspect = MagicMock(
+    ]
+    project_analyzer.inspector.inspect_records = MagicMock(
         return_value=mock_inspection_results
     )
 
@@ -151,8 +161,8 @@ def test_analyze_projects_sequential(
         "test/unit_testing/components/mock_project_path", resume=False
     )
 
-    # Ensure inspect was called
-    project_analyzer.inspector.inspect.assert_called_with("file1.py")
+    # Ensure inspect_records was called
+    project_analyzer.inspector.inspect_records.assert_called_with("file1.py")
 
     mock_project_path = "test/unit_testing/components/mock_project_path"
     if os.path.exists(mock_project_path):
@@ -199,22 +209,26 @@ def test_merge_all_results(monkeypatch, project_analyzer):
 
 
 def test_analyze_projects_parallel(
-    monkeypatch, project_analyzer, mock_file_related_methods, tmp_path
+    monkeypatch,
+    project_analyzer,
+    mock_file_related_methods,
+    in_process_executor,
+    tmp_path,
 ):
     """
     Test the `analyze_projects_parallel` method.
     """
 
-    mock_inspection_results = pd.DataFrame(
+    mock_inspection_results = [
         {
-            "filename": ["file1.py"],
-            "function_name": ["func1"],
-            "smell_name": ["smell1"],
-            "line": [10],
-            "description": ["desc1"],
-            "additional_info": ["info1"],
+            "filename": "file1.py",
+            "function_name": "func1",
+            "smell_name": "smell1",
+            "line": 10,
+            "description": "desc1",
+            "additional_info": "info1",
         }
-    )
+    ]
 
     # Mock dependencies
     monkeypatch.setattr(
@@ -225,8 +239,8 @@ def test_analyze_projects_parallel(
         lambda path: True,  # Mock that all paths are directories
     )
 
-    # Mock the inspector's inspect method
-    project_analyzer.inspector.inspect = MagicMock(
+    # Mock the inspector's inspect_records method
+    project_analyzer.inspector.inspect_records = MagicMock(
         return_value=mock_inspection_results
     )
 
@@ -236,39 +250,33 @@ def test_analyze_projects_parallel(
         lambda self, df, path: None,  # Do nothing on saving results
     )
 
-    # Mock ThreadPoolExecutor to avoid threading and run tasks synchronously
-    with patch("concurrent.futures.ThreadPoolExecutor") as MockExecutor:
-        mock_executor = MagicMock()
-        MockExecutor.return_value = mock_executor
-        mock_executor.__enter__.return_value = mock_executor
-        # Make sure the function gets executed immediately (synchronously)
-        mock_executor.submit.side_effect = lambda func, *args, **kwargs: func(
-            *args, **kwargs
+    # Run the method
+    with patch("builtins.print") as mock_print:
+        project_analyzer.analyze_projects_parallel(
+            str(tmp_path), max_workers=1
         )
 
-        # Run the method
-        with patch("builtins.print") as mock_print:
-            project_analyzer.analyze_projects_parallel(
-                "test/unit_testing/components/mock_base_path", max_workers=1
-            )
+    # Ensure the inspector's inspect_records method
+    # was called the expected number of times
+    assert project_analyzer.inspector.inspect_records.call_count == 2
 
-        # Ensure the inspector's inspect method
-        # was called the expected number of times
-        assert project_analyzer.inspector.inspect.call_count == 2
-
-        # Check if print statements were made (optional)
-        assert mock_print.call_count > 0
+    # Check if print statements were made (optional)
+    assert mock_print.call_count > 0
 
 
 def test_exception_handling_in_inspect(
-    monkeypatch, project_analyzer, mock_file_related_methods, tmp_path
+    monkeypatch,
+    project_analyzer,
+    mock_file_related_methods,
+    in_process_executor,
+    tmp_path,
 ):
     """
     Test that the `inspect` method handles exceptions gracefully.
     """
 
-    # Simulate an exception in the inspect method
-    project_analyzer.inspector.inspect = MagicMock(
+    # Simulate an exception in the inspect_records method
+    project_analyzer.inspector.inspect_records = MagicMock(
         side_effect=FileNotFoundError
     )
 
@@ -309,7 +317,9 @@ def test_analyze_project_with_errors(
     )
 
     # Mocking a SyntaxError for a specific file
-    project_analyzer.inspector.inspect = MagicMock(side_effect=SyntaxError)
+    project_analyzer.inspector.inspect_records = MagicMock(
+        side_effect=SyntaxError
+    )
 
     # Run the method (simulate failure for file1.py)
     project_analyzer.analyze_project(
@@ -349,16 +359,16 @@ def test_analyze_projects_sequential_save_results(
         ),
     )
 
-    # Mock the inspector's inspect method
-    mock_inspection_results = pd.DataFrame(
+    # Mock the inspector's inspect_records method
+    mock_inspection_results = [
         {
-            "filename": ["file1.py"],
-            "function_name": ["func1"],
-            "smell_name": ["smell1"],
-            "line": [10],
+            "filename": "file1.py",
+            "function_name": "func1",
+            "smell_name": "smell1",
+            "line": 10,
         }
-    )
-    project_analyzer.inspector.inspect = MagicMock(
+    ]
+    project_analyzer.inspector.inspect_records = MagicMock(
         return_value=mock_inspection_results
     )
 
@@ -385,50 +395,44 @@ def test_analyze_projects_sequential_save_results(
         shutil.rmtree(mock_project_path)
 
 
-def test_analyze_projects_parallel_thread_safety(
-    monkeypatch, project_analyzer, mock_file_related_methods, tmp_path
+def test_analyze_projects_parallel_logs_projects(
+    monkeypatch,
+    project_analyzer,
+    mock_file_related_methods,
+    in_process_executor,
+    tmp_path,
 ):
     """
-    Test thread-safety in the `analyze_projects_parallel` method.
+    Test that `analyze_projects_parallel` logs every analyzed project.
     """
 
-    mock_inspection_results = pd.DataFrame(
+    mock_inspection_results = [
         {
-            "filename": ["file1.py"],
-            "function_name": ["func1"],
-            "smell_name": ["smell1"],
-            "line": [10],
-            "description": ["desc1"],
-            "additional_info": ["info1"],
+            "filename": "file1.py",
+            "function_name": "func1",
+            "smell_name": "smell1",
+            "line": 10,
+            "description": "desc1",
+            "additional_info": "info1",
         }
-    )
+    ]
 
-    # Mock the inspector's inspect method
-    project_analyzer.inspector.inspect = MagicMock(
+    # Mock the inspector's inspect_records method
+    project_analyzer.inspector.inspect_records = MagicMock(
         return_value=mock_inspection_results
     )
 
-    # Mock the synchronized_append_to_log method to check for thread-safety
-    mock_synchronized_append = MagicMock()
-    monkeypatch.setattr(
-        "utils.file_utils.FileUtils.synchronized_append_to_log",
-        mock_synchronized_append,
-    )
-
     # Run the method with parallel execution
     project_analyzer.analyze_projects_parallel(
         "test/unit_testing/components/mock_base_path", max_workers=2
     )
 
-    # Normalize the paths for cross-platform consistency
-    expected_path = os.path.join(
+    # Ensure both project1 and project2 were written to the log
+    log_path = os.path.join(
         "test/unit_testing/components/mock_base_path", "execution_log.txt"
     )
-
-    # Ensure the synchronized_append_to_log
-    # method was called with both project1 and project2
-    mock_synchronized_append.assert_any_call(expected_path, "project1", ANY)
-    mock_synchronized_append.assert_any_call(expected_path, "project2", ANY)
+    with open(log_path, "r") as log_file:
+        assert sorted(log_file.read().split()) == ["project1", "project2"]
 
     mock_project_path = "test/unit_testing/components/mock_base_path"
     if os.path.exists(mock_project_path):
@@ -466,3 +470,68 @@ def test_analyze_project_empty_directory(
 
     # Assert that no smells are found
     assert total_smells == 0
+
+
+def test_analyze_project_parallel_matches_sequential(
+    project_analyzer, tmp_path
+):
+    """
+    Test that file-level parallel analysis finds the same smells as the
+    sequential one and still logs files that fail to parse.
+    """
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    source = (
+        "import pandas as pd\n\n"
+        "def load():\n"
+        "    df = pd.DataFrame()\n"
+        "    df['a'][0] = 1\n"
+        "    return df\n"
+    )
+    for index in range(4):
+        (project_path / f"module{index}.py").write_text(source)
+    (project_path / "broken.py").write_text("def broken(:\n")
+
+    sequential_smells = project_analyzer.analyze_project(str(project_path))
+    parallel_smells = project_analyzer.analyze_project(
+        str(project_path), max_workers=2
+    )
+
+    assert sequential_smells > 0
+    assert parallel_smells == sequential_smells
+
+    error_file = os.path.join(project_analyzer.output_path, "error.txt")
+    with open(error_file, "r") as f:
+        error_lines = f.readlines()
+    assert len(error_lines) == 2
+    assert all("broken.py" in line for line in error_lines)
+
+
+def test_analyze_projects_parallel_in_processes(project_analyzer, tmp_path):
+    """
+    Test that projects analyzed in worker processes save their detailed
+    results and are recorded in the execution log.
+    """
+    base_path = tmp_path / "projects"
+    source = (
+        "import pandas as pd\n\n"
+        "def load():\n"
+        "    df = pd.DataFrame()\n"
+        "    df['a'][0] = 1\n"
+        "    return df\n"
+    )
+    for project in ["project1", "project2"]:
+        (base_path / project).mkdir(parents=True)
+        (base_path / project / "module.py").write_text(source)
+
+    project_analyzer.analyze_projects_parallel(str(base_path), max_workers=2)
+
+    for project in ["project1", "project2"]:
+        detailed_file_path = os.path.join(
+            project_analyzer.details_path, f"{project}_results.csv"
+        )
+        assert not pd.read_csv(detailed_file_path).empty
+
+    with open(base_path / "execution_log.txt", "r") as log_file:
+        logged_projects = sorted(log_file.read().split())
+    assert logged_projects == ["project1", "project2"]
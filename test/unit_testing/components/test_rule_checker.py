@@ -40,6 +40,10 @@ def test_rule_check(mocker, mock_rule_checker, mock_ast_node, df_output):
     # Mock the classes for DataFrameConversionAPIMisused and ChainIndexingSmell
     mock_dataframe_conversion = mocker.Mock()
     mock_chain_indexing = mocker.Mock()
+    mock_dataframe_conversion.required_library = "pandas"
+    mock_chain_indexing.required_library = "pandas"
+    mock_dataframe_conversion.requires_alias_reference = False
+    mock_chain_indexing.requires_alias_reference = False
 
     # Mocking the return value of detect for
     #  DataFrameConversionAPIMisused
@@ -166,3 +170,82 @@ def test_no_smells(mocker, mock_rule_checker, mock_ast_node, df_output):
 
     # Assertions
     assert len(result) == 0  # No smells detected
+
+
+def test_rule_check_skips_smells_for_missing_libraries(
+    mocker, mock_rule_checker, mock_ast_node, df_output
+):
+    # A smell tied to a library the file does not import is never run
+    mock_torch_smell = mocker.Mock()
+    mock_torch_smell.required_library = "torch"
+    mock_generic_smell = mocker.Mock()
+    mock_generic_smell.required_library = None
+    mock_generic_smell.requires_alias_reference = False
+    mock_generic_smell.detect.return_value = []
+
+    mock_rule_checker.smells = [mock_torch_smell, mock_generic_smell]
+
+    extracted_data = {"libraries": {"pandas": "pd"}}
+
+    mock_rule_checker.rule_check(
+        mock_ast_node, extracted_data, "mock_file.py", "my_function", df_output
+    )
+
+    mock_torch_smell.detect.assert_not_called()
+    mock_generic_smell.detect.assert_called_once_with(
+        mock_ast_node, extracted_data
+    )
+
+
+def test_detect_smells_returns_rows(mocker, mock_rule_checker, mock_ast_node):
+    mock_smell = mocker.Mock()
+    mock_smell.required_library = None
+    mock_smell.requires_alias_reference = False
+    mock_smell.detect.return_value = [
+        {
+            "name": "smell1",
+            "line": 3,
+            "description": "description1",
+            "additional_info": "info1",
+        }
+    ]
+    mock_rule_checker.smells = [mock_smell, mock_smell]
+
+    rows = mock_rule_checker.detect_smells(
+        mock_ast_node, {"libraries": {}}, "mock_file.py", "my_function"
+    )
+
+    assert rows == [
+        {
+            "filename": "mock_file.py",
+            "function_name": "my_function",
+            "smell_name": "smell1",
+            "line": 3,
+            "description": "description1",
+            "additional_info": "info1",
+        }
+    ] * 2
+
+
+def test_rule_check_skips_functions_without_alias(
+    mocker, mock_rule_checker, df_output
+):
+    # A smell that needs the alias only runs where the function names it
+    mock_smell = mocker.Mock()
+    mock_smell.required_library = "numpy"
+    mock_smell.requires_alias_reference = True
+    mock_smell.detect.return_value = []
+    mock_rule_checker.smells = [mock_smell]
+    extracted_data = {"libraries": {"numpy": "np"}}
+
+    without_alias = ast.parse("def f(x):\n    return x + 1\n").body[0]
+    mock_rule_checker.rule_check(
+        without_alias, extracted_data, "mock_file.py", "f", df_output
+    )
+    mock_smell.detect.assert_not_called()
+
+    with_alias = ast.parse("def f(x):\n    return np.dot(x, x)\n").body[0]
+    mock_rule_checker.rule_check(
+        with_alias, extracted_data, "mock_file.py", "f", df_output
+    )
+    mock_smell.detect.assert_called_once_with(with_alias, extracted_data)
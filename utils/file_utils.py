@@ -1,6 +1,16 @@
+import logging
 import os
 import shutil
-import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Directories not descended into by default when collecting Python files
+SKIPPED_DIRS = frozenset(
+    {"venv", "lib", ".git", "__pycache__", "node_modules"}
+)
+
+# Chunk size used when appending result files to the merged overview
+MERGE_BUFFER_SIZE = 1 << 20
 
 
 class FileUtils:
@@ -23,45 +33,96 @@ class FileUtils:
         output_path = os.path.join(root_path, subfolder_name)
 
         if os.path.exists(output_path):
-            for filename in os.listdir(output_path):
-                file_path = os.path.join(output_path, filename)
-                try:
-                    if os.path.isfile(file_path) or os.path.islink(file_path):
-                        os.unlink(file_path)
-                    elif os.path.isdir(file_path):
-                        shutil.rmtree(file_path)
-                except Exception as e:
-                    print(f"Failed to delete {file_path}. Reason: {e}")
+            # Entry types come from the listing itself; symlinks are
+            # removed as links, never followed
+            with os.scandir(output_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
+                    except OSError as e:
+                        print(f"Failed to delete {entry.path}. Reason: {e}")
         else:
             os.makedirs(output_path)
 
         return output_path
 
     @staticmethod
-    def get_python_files(path: str) -> list[str]:
+    def get_python_files(
+        path: str, skip_dirs: frozenset[str] = SKIPPED_DIRS
+    ) -> list[str]:
         """
         Retrieves all Python files from the specified path.
 
         Parameters:
         - path (str): Path to search for Python files.
+        - skip_dirs (frozenset[str]): Names of the directories whose
+          contents are left out, e.g. `SKIPPED_DIRS | {"tests"}`.
 
         Returns:
         - list[str]: List of Python file paths.
         """
-        result = []
         if os.path.isfile(path) and path.endswith(".py"):
             return [path]
 
-        for root, dirs, files in os.walk(path):
-            if "venv" in dirs:
-                dirs.remove("venv")
-            if "lib" in dirs:
-                dirs.remove("lib")
-            for file in files:
-                if file.endswith(".py"):
-                    result.append(os.path.abspath(os.path.join(root, file)))
+        # Entries under an absolute root already carry absolute paths
+        return FileUtils._walk_python_files(os.path.abspath(path), skip_dirs)
+
+    @staticmethod
+    def _walk_python_files(path: str, skip_dirs: frozenset[str]) -> list[str]:
+        """
+        Collects the Python files below a directory, pruning the
+        directories named in `skip_dirs` before descending.
+        Directories are visited from an explicit stack, so deep trees
+        neither hit the recursion limit nor pass each path through a
+        chain of nested generators.
+
+        Parameters:
+        - path (str): Directory to scan.
+        - skip_dirs (frozenset[str]): Names of the directories to prune.
+
+        Returns:
+        - list[str]: Paths of the Python files found.
+        """
+        result = []
+        pending = [path]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        result.append(entry.path)
         return result
 
+    @staticmethod
+    def get_project_dirs(base_path: str) -> list[str]:
+        """
+        Lists the project directories directly under a base path,
+        leaving out the analysis `output` folder.
+
+        Parameters:
+        - base_path (str): Directory containing the projects.
+
+        Returns:
+        - list[str]: Names of the project directories.
+        """
+        # `DirEntry.is_dir` reuses the type reported by the directory
+        # listing; only symlinks, which are followed, need a `stat`
+        with os.scandir(base_path) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name != "output" and entry.is_dir()
+            ]
+
     @staticmethod
     def merge_results(input_dir: str, output_dir: str):
         """
@@ -72,28 +133,60 @@ class FileUtils:
           analysis results (project_name.csv files).
         - output_dir (str): Directory where the merged results will be saved.
         """
-        dataframes = []
+        merged_path = os.path.join(output_dir, "overview.csv")
+        header = None
+        merged_file = None
         print(f"Looking for CSV files in directory: {input_dir}")
 
-        for subdir, _, files in os.walk(input_dir):
-            for file in files:
-                if file.endswith(".csv"):
-                    file_path = os.path.join(subdir, file)
-                    try:
-                        df = pd.read_csv(file_path)
-                        if not df.empty:
-                            dataframes.append(df)
-                        else:
-                            print(f"Skipping empty CSV: {file_path}")
-                    except Exception as e:
-                        print(f"Failed to read {file_path}: {e}")
-
-        if dataframes:
-            combined_df = pd.concat(dataframes, ignore_index=True)
-            os.makedirs(output_dir, exist_ok=True)
-            combined_df.to_csv(
-                os.path.join(output_dir, "overview.csv"), index=False
-            )
+        # Project results are written flat into `input_dir`; a sorted
+        # listing keeps the merged rows in a stable order
+        try:
+            with os.scandir(input_dir) as entries:
+                csv_paths = sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(".csv")
+                    and entry.is_file(follow_symlinks=False)
+                )
+        except OSError:
+            csv_paths = []
+
+        try:
+            for file_path in csv_paths:
+                try:
+                    with open(file_path, "rb") as source:
+                        file_header = source.readline()
+                        first_row = source.readline()
+                        if not first_row:
+                            logger.debug("Skipping empty CSV: %s", file_path)
+                            continue
+
+                        if merged_file is None:
+                            # Header is written once, from the first file
+                            os.makedirs(output_dir, exist_ok=True)
+                            merged_file = open(merged_path, "wb")
+                            header = file_header
+                            merged_file.write(header)
+                        elif file_header != header:
+                            print(
+                                f"Skipping {file_path}: "
+                                "header does not match."
+                            )
+                            continue
+
+                        # Rows are appended as raw bytes, without
+                        # decoding or parsing them
+                        merged_file.write(first_row)
+                        shutil.copyfileobj(
+                            source, merged_file, MERGE_BUFFER_SIZE
+                        )
+                except Exception as e:
+                    print(f"Failed to read {file_path}: {e}")
+        finally:
+            if merged_file is not None:
+                merged_file.close()
+
+        if merged_file is not None:
             print(f"Merged results saved to {output_dir}/overview.csv")
         else:
             print("No valid CSV files found to merge.")
@@ -123,6 +216,33 @@ class FileUtils:
             log_file.write(project_name + "\n")
         print(f"Appended to log: {project_name}")
 
+    @staticmethod
+    def open_log(log_path: str):
+        """
+        Opens an execution log for appending the projects of a whole run.
+        The file is line-buffered, so every entry reaches the log as soon
+        as it is written.
+
+        Parameters:
+        - log_path (str): Path to the log file.
+
+        Returns:
+        - TextIO: The open log file.
+        """
+        return open(log_path, "a", buffering=1)
+
+    @staticmethod
+    def write_to_log(log_file, project_name: str):
+        """
+        Appends a project name to an execution log opened with `open_log`.
+
+        Parameters:
+        - log_file (TextIO): The open log file.
+        - project_name (str): Name of the project to append to the log.
+        """
+        log_file.write(project_name + "\n")
+        print(f"Appended to log: {project_name}")
+
     @staticmethod
     def get_last_logged_project(log_path: str) -> str:
         """